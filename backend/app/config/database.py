@@ -13,5 +13,8 @@ def get_supabase() -> Client:
     return SupabaseClient.get_client()
 
 
-# Alias for convenience
-supabase = get_supabase()
+def __getattr__(name: str):
+    """Resolve the ``supabase`` alias lazily so importing this module does no client setup."""
+    if name == "supabase":
+        return get_supabase()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
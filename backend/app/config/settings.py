@@ -5,7 +5,8 @@ Centralized configuration management using Pydantic BaseSettings.
 All settings are loaded from environment variables.
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
 from typing import List, Optional
 import os
 
@@ -52,12 +53,20 @@ class Settings(BaseSettings):
     NVIDIA_NIM_BASE_URL: str = "https://integrate.api.nvidia.com/v1"
     NVIDIA_NIM_MODEL: str = "meta/llama-3.3-70b-instruct"  # Supports function calling
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        # Resolved once at import so pydantic-settings gets an absolute path
+        env_file=os.path.abspath(".env"),
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+    )
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance (usable as a FastAPI dependency)"""
+    return Settings()
+
+
+# Global settings instance (kept for existing imports)
+settings = get_settings()
 
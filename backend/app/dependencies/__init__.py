@@ -1,5 +1,6 @@
 """Dependencies module"""
 from app.dependencies.auth import get_current_user, get_optional_user
+from app.dependencies.authz import AuthzContext
 from app.dependencies.rbac import (
     require_role,
     require_permission,
@@ -8,6 +9,7 @@ from app.dependencies.rbac import (
 )
 
 __all__ = [
+    "AuthzContext",
     "get_current_user",
     "get_optional_user",
     "require_role",
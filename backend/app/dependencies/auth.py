@@ -4,27 +4,156 @@ Authentication Dependencies
 FastAPI dependencies for JWT validation and user authentication using Supabase.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from typing import Optional
+from jwt.exceptions import InvalidTokenError
+import jwt
+from typing import Dict, Optional, Tuple
+import base64
+import hashlib
+import hmac
+import json
 import logging
+import time
 
 from app.config.settings import settings
 from app.services.supabase_client import supabase_client
 
 logger = logging.getLogger(__name__)
 
-security = HTTPBearer()
+# Single bearer scheme shared by get_current_user and get_optional_user; missing
+# credentials are handled by the dependencies themselves.
+security = HTTPBearer(auto_error=False)
+
+# The secret never changes at runtime, so encode it once rather than per decode
+_JWT_SECRET_BYTES = settings.SUPABASE_JWT_SECRET.encode("utf-8")
+_JWT_ALGS = ["HS256"]
+
+# Validated token payloads keyed by a digest of the raw token (raw tokens are
+# never stored). Entries live at most TOKEN_CACHE_TTL seconds and never past
+# the token's own ``exp``.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: Dict[bytes, Tuple[dict, float]] = {}
+
+
+# Supabase mints HS256 tokens with this exact header, so its base64url form is
+# a constant that can be matched without decoding JSON.
+_EXPECTED_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=").decode()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _fast_decode(token: str) -> Optional[dict]:
+    """
+    Verify a token carrying the expected HS256 header without a full decode.
+    
+    Returns the payload, or None when the token does not take the fast path
+    (unexpected header, bad signature, expired, wrong audience) so the caller
+    can fall back to ``jwt.decode`` for the authoritative result.
+    """
+    parts = token.split(".", 2)
+    if len(parts) != 3 or parts[0] != _EXPECTED_HEADER_B64:
+        return None
+    
+    try:
+        signing_input = token[: len(parts[0]) + len(parts[1]) + 1].encode()
+        expected = hmac.new(_JWT_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(parts[2])):
+            return None
+        payload = json.loads(_b64url_decode(parts[1]))
+    except (ValueError, TypeError):
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    
+    now = time.time()
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp <= now:
+        return None
+    nbf = payload.get("nbf")
+    if nbf is not None and (not isinstance(nbf, (int, float)) or nbf > now):
+        return None
+    aud = payload.get("aud")
+    if aud != "authenticated" and not (isinstance(aud, list) and "authenticated" in aud):
+        return None
+    
+    return payload
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _decode_token(token: str) -> dict:
+    """
+    Decode and verify a JWT, reusing the payload of recently validated tokens.
+    
+    Raises:
+        InvalidTokenError: If the token is invalid or expired
+    """
+    key = _token_cache_key(token)
+    now = time.time()
+    
+    cached = _token_cache.get(key)
+    if cached is not None:
+        payload, valid_until = cached
+        if valid_until > now:
+            return payload
+        # Expired (or past the cache TTL): drop it and verify from scratch
+        _token_cache.pop(key, None)
+    
+    payload = _fast_decode(token)
+    if payload is None:
+        payload = jwt.decode(
+            token,
+            _JWT_SECRET_BYTES,
+            algorithms=_JWT_ALGS,
+            audience="authenticated",
+            options={"require": ["exp", "sub", "aud"]}
+        )
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        _token_cache.pop(next(iter(_token_cache)), None)
+    # The entry is only trusted until the earlier of the cache TTL and exp
+    _token_cache[key] = (payload, min(now + TOKEN_CACHE_TTL, payload["exp"]))
+    return payload
+
+
+def verify_token(token: str) -> Optional[dict]:
+    """Return the verified payload of a token, or None if it is invalid"""
+    try:
+        return _decode_token(token)
+    except InvalidTokenError:
+        return None
+
+
+def user_from_payload(payload: dict) -> dict:
+    """Build the current-user dict handed to routes from a verified payload"""
+    return {
+        "id": payload.get("sub"),
+        "email": payload.get("email"),
+        "role": payload.get("role"),
+        "aud": payload.get("aud"),
+    }
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> dict:
     """
     Validate JWT token and return current user.
     
+    Uses the user already resolved by AuthContextMiddleware when present,
+    so the token is decoded at most once per request.
+    
     Args:
+        request: Incoming request
         credentials: HTTP Bearer token from request header
         
     Returns:
@@ -33,16 +162,22 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or expired
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     token = credentials.credentials
     
     try:
-        # Decode JWT token using Supabase JWT secret
-        payload = jwt.decode(
-            token,
-            settings.SUPABASE_JWT_SECRET,
-            algorithms=["HS256"],
-            audience="authenticated"
-        )
+        # Decode JWT token using Supabase JWT secret (cached per token)
+        payload = _decode_token(token)
         
         user_id: str = payload.get("sub")
         if user_id is None:
@@ -53,15 +188,12 @@ async def get_current_user(
             )
         
         # Return user data from token
-        return {
-            "id": user_id,
-            "email": payload.get("email"),
-            "role": payload.get("role"),
-            "aud": payload.get("aud"),
-        }
+        user = user_from_payload(payload)
+        request.state.user = user
+        return user
         
-    except JWTError as e:
-        logger.error(f"JWT validation error: {str(e)}")
+    except InvalidTokenError as e:
+        logger.error("JWT validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -70,7 +202,8 @@ async def get_current_user(
 
 
 async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[dict]:
     """
     Get current user if authenticated, otherwise return None.
@@ -80,6 +213,6 @@ async def get_optional_user(
         return None
     
     try:
-        return await get_current_user(credentials)
+        return await get_current_user(request, credentials)
     except HTTPException:
         return None
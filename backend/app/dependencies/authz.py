@@ -0,0 +1,43 @@
+"""
+Authorization Context
+=====================
+Per-request authorization data returned by the RBAC dependencies.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+
+@dataclass(slots=True)
+class AuthzContext:
+    """
+    Authenticated user plus the roles, permissions and stores resolved for them.
+    
+    Supports read-only mapping-style access (``ctx["id"]``, ``ctx.get("roles", [])``)
+    so routers written against the previous enriched user dict keep working.
+    """
+    
+    id: str
+    email: Optional[str] = None
+    role: Optional[str] = None
+    aud: Optional[str] = None
+    roles: Tuple[str, ...] = ()
+    permissions: Tuple[str, ...] = ()
+    store_ids: Tuple[int, ...] = ()
+    
+    @property
+    def user_id(self) -> str:
+        """Alias of ``id`` used by the poultry routers"""
+        return self.id
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        return hasattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
@@ -5,16 +5,32 @@ FastAPI dependencies for role and permission checking.
 """
 
 from fastapi import Depends, HTTPException, status
-from typing import List, Callable
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable
 import logging
 
 from app.dependencies.auth import get_current_user
+from app.dependencies.authz import AuthzContext
 from app.services.role_service import RoleService
 
 logger = logging.getLogger(__name__)
 
+# RoleService is stateless apart from the shared Supabase client, so one
+# instance serves every request.
+_role_service = RoleService()
 
-def require_role(allowed_roles: List[str]) -> Callable:
+
+async def _current_user_auth_bundle(current_user: dict = Depends(get_current_user)) -> dict:
+    """
+    Permissions, roles and store IDs of the current user.
+    
+    Exposed as its own dependency so FastAPI's per-request dependency cache
+    shares a single lookup between every RBAC check in the same request.
+    """
+    return await _role_service.get_user_auth_bundle(current_user.get("id"))
+
+
+def require_role(allowed_roles: Iterable[str]) -> Callable:
     """
     Dependency factory to require specific roles.
     
@@ -22,45 +38,59 @@ def require_role(allowed_roles: List[str]) -> Callable:
         @router.get("/admin", dependencies=[Depends(require_role(["Admin"]))])
         
     Args:
-        allowed_roles: List of role names that are allowed
+        allowed_roles: Role names that are allowed
         
     Returns:
-        Dependency function
+        Dependency function. Identical role sets get the same function, so
+        FastAPI's per-request dependency cache runs a repeated check once.
     """
-    async def role_checker(current_user: dict = Depends(get_current_user)):
+    return _role_checker(frozenset(allowed_roles))
+
+
+@lru_cache(maxsize=None)
+def _role_checker(allowed: FrozenSet[str]) -> Callable:
+    """Build (once per role set) the checker returned by require_role"""
+    allowed_display = ", ".join(sorted(allowed))
+    
+    async def role_checker(
+        current_user: dict = Depends(get_current_user),
+        bundle: dict = Depends(_current_user_auth_bundle),
+    ) -> AuthzContext:
         user_id = current_user.get("id")
         
         # Get user roles
-        role_service = RoleService()
-        user_roles = await role_service.get_user_roles(user_id)
-        user_role_names = [role["name"] for role in user_roles]
+        user_roles = bundle["roles"]
+        user_role_names = tuple(role["name"] for role in user_roles)
         
         # Check if user has any of the allowed roles
-        has_role = any(role in allowed_roles for role in user_role_names)
-        
-        if not has_role:
+        if allowed.isdisjoint(user_role_names):
             logger.warning(
-                f"User {user_id} attempted to access resource requiring roles {allowed_roles}. "
+                f"User {user_id} attempted to access resource requiring roles [{allowed_display}]. "
                 f"User has roles: {user_role_names}"
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {', '.join(allowed_roles)}"
+                detail=f"Insufficient permissions. Required roles: {allowed_display}"
             )
         
-        # Enrich user object with roles and store_ids for downstream validation
-        current_user["roles"] = user_role_names
-        current_user["store_ids"] = await role_service.get_user_store_ids(user_id)
-        current_user["user_id"] = user_id  # Added for compatibility with poultry routers
+        # Roles and store_ids for downstream validation
+        context = AuthzContext(
+            id=user_id,
+            email=current_user.get("email"),
+            role=current_user.get("role"),
+            aud=current_user.get("aud"),
+            roles=user_role_names,
+            store_ids=tuple(bundle["store_ids"]),
+        )
         
-        logger.info(f"Enriched role user {user_id}: roles={len(user_role_names)}, stores={len(current_user['store_ids'])}")
+        logger.debug("Authorized role user %s: roles=%d, stores=%d", user_id, len(context.roles), len(context.store_ids))
         
-        return current_user
+        return context
     
     return role_checker
 
 
-def require_permission(required_permissions: List[str]) -> Callable:
+def require_permission(required_permissions: Iterable[str]) -> Callable:
     """
     Dependency factory to require specific permissions.
     
@@ -68,51 +98,67 @@ def require_permission(required_permissions: List[str]) -> Callable:
         @router.get("/users", dependencies=[Depends(require_permission(["users.read"]))])
         
     Args:
-        required_permissions: List of permission keys that are required
+        required_permissions: Permission keys that are required
         
     Returns:
-        Dependency function
+        Dependency function. Identical permission sets get the same function,
+        so FastAPI's per-request dependency cache runs a repeated check once.
     """
-    async def permission_checker(current_user: dict = Depends(get_current_user)):
+    return _permission_checker(frozenset(required_permissions))
+
+
+@lru_cache(maxsize=None)
+def _permission_checker(required: FrozenSet[str]) -> Callable:
+    """Build (once per permission set) the checker returned by require_permission"""
+    required_display = ", ".join(sorted(required))
+    
+    async def permission_checker(
+        current_user: dict = Depends(get_current_user),
+        bundle: dict = Depends(_current_user_auth_bundle),
+    ) -> AuthzContext:
         user_id = current_user.get("id")
         
         # Get user permissions
-        role_service = RoleService()
-        user_permissions = await role_service.get_user_permissions(user_id)
+        user_permissions = bundle["permissions"]
         
-        # DEBUG: Log what permissions the user has
-        logger.info(f"User {user_id} has permissions: {user_permissions}")
-        logger.info(f"Required permissions: {required_permissions}")
+        logger.debug("User %s has permissions: %s", user_id, user_permissions)
+        logger.debug("Required permissions: %s", required_display)
         
         # Check if user has all required permissions
-        has_all_permissions = all(perm in user_permissions for perm in required_permissions)
+        missing_permissions = required.difference(user_permissions)
         
-        if not has_all_permissions:
-            missing_permissions = [perm for perm in required_permissions if perm not in user_permissions]
+        if missing_permissions:
             logger.warning(
-                f"User {user_id} attempted to access resource requiring permissions {required_permissions}. "
-                f"Missing: {missing_permissions}. User has: {user_permissions}"
+                f"User {user_id} attempted to access resource requiring permissions [{required_display}]. "
+                f"Missing: {sorted(missing_permissions)}. User has: {user_permissions}"
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required: {', '.join(required_permissions)}"
+                detail=f"Insufficient permissions. Required: {required_display}"
             )
         
-        # Enrich user object with roles, permissions, and store_ids for downstream validation (e.g. validate_store_access)
-        user_roles = await role_service.get_user_roles(user_id)
-        current_user["roles"] = [role["name"] for role in user_roles]
-        current_user["permissions"] = user_permissions  # Added for permission-based logic in routers
-        current_user["store_ids"] = await role_service.get_user_store_ids(user_id)
-        current_user["user_id"] = user_id  # Added for compatibility with poultry routers
+        # Roles, permissions, and store_ids for downstream validation (e.g. validate_store_access)
+        context = AuthzContext(
+            id=user_id,
+            email=current_user.get("email"),
+            role=current_user.get("role"),
+            aud=current_user.get("aud"),
+            roles=tuple(role["name"] for role in bundle["roles"]),
+            permissions=tuple(user_permissions),
+            store_ids=tuple(bundle["store_ids"]),
+        )
         
-        logger.info(f"Enriched perm user {user_id}: roles={current_user['roles']}, stores={current_user['store_ids']}")
+        logger.debug("Authorized perm user %s: roles=%s, stores=%s", user_id, context.roles, context.store_ids)
         
-        return current_user
+        return context
     
     return permission_checker
 
 
 
 # Convenience dependencies for common roles
-require_admin = require_role(["Admin"])
-require_admin_or_manager = require_role(["Admin", "Manager"])
+_ADMIN = frozenset(("Admin",))
+_ADMIN_MGR = frozenset(("Admin", "Manager"))
+
+require_admin = require_role(_ADMIN)
+require_admin_or_manager = require_role(_ADMIN_MGR)
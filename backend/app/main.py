@@ -7,17 +7,22 @@ Includes CORS, exception handlers, and router registration.
 
 from fastapi import FastAPI, Request, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
+from functools import lru_cache
+from pathlib import Path
 import logging
 
 from app.config.settings import settings
 from app.routers import auth, users, roles, permissions, admin, health, business_management, rate_limits, ai, activity_logs, user_dashboard, transaction_logs
 from app.routers.poultry_retail import router as poultry_retail_router
 from app.utils.logger import setup_logging
-from app.middleware.session_tracker import SessionTrackerMiddleware
-from app.middleware.rate_limiter import RateLimiterMiddleware
+from app.middleware.session_tracker import session_writer
+from app.middleware.auth_context import AuthContextMiddleware
+from app.services.cache_invalidation import cache_invalidation_listener
+from app.services.audit_service import audit_writer
 from app.dependencies.auth import get_current_user
 from app.dependencies.rbac import require_permission
 
@@ -29,53 +34,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    description="""
-## Venus Chicken - Enterprise SaaS Starter Kit
-
-**Your Application's Control Center** with enterprise-grade RBAC and beautiful admin panel.
-
-### ✨ Key Features
-
-- 🔐 **Advanced RBAC** - Comprehensive permission-based access control
-- 🎯 **Dynamic Permission Display** - Automatically shows all user permissions
-- 👥 **User Management** - Complete user and role administration
-- 📊 **Audit Logging** - Track all system changes
-- 🏥 **Health Monitoring** - Real-time backend and database status
-- 🎨 **Beautiful Admin UI** - Modern, responsive interface
-
-### 🔑 Permission System
-
-Venus Chicken implements a sophisticated permission system:
-
-- **Permission Format**: `<resource>.<action>` (e.g., `users.read`, `systemdashboard.view`)
-- **Dynamic Features**: New permissions automatically appear in the UI
-- **Feature Mapping**: Known permissions display as feature cards with icons
-- **Granular Control**: Protect pages, components, and API endpoints
-
-### 📖 Available Permissions
-
-- `systemdashboard.view` - View system dashboard
-- `users.read` - View users
-- `users.write` - Create/update users
-- `roles.read` - Manage roles
-- `permissions.read` - Manage permissions
-- `system.admin` - Admin access
-- `system.settings` - Access settings
-- `system.logs` - View audit logs
-- `system.docs` - Access documentation
-- `system.status` - View status indicators
-- `test.run` - Run test suite
-
-### 🚀 Getting Started
-
-1. **Authenticate**: Use `/api/v1/auth/login` to get JWT token
-2. **Include Token**: Add `Authorization: Bearer <token>` header to requests
-3. **Check Permissions**: User permissions returned in `/api/v1/users/me`
-
-### 🔒 Security
-
-All admin endpoints require appropriate permissions. See endpoint descriptions for required permissions.
-""",
+    description="Venus Chicken API",
+    default_response_class=ORJSONResponse,
     docs_url=None,      # Disable default - we'll add auth-protected version
     redoc_url=None,     # Disable default - we'll add auth-protected version
     openapi_url=None,   # Disable default - we'll add auth-protected version
@@ -85,9 +45,17 @@ All admin endpoints require appropriate permissions. See endpoint descriptions f
 # AUTH-PROTECTED API DOCUMENTATION
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _full_description() -> str:
+    """Long-form API description, read only when the OpenAPI schema is first built"""
+    return (Path(__file__).parent / "docs" / "description.md").read_text(encoding="utf-8")
+
+
 @app.get("/openapi.json", include_in_schema=False)
 async def get_openapi_schema(current_user: dict = Depends(require_permission(["system.docs"]))):
     """OpenAPI schema - requires system.docs permission"""
+    if app.openapi_schema is None:
+        app.description = _full_description()
     return app.openapi()
 
 @app.get("/docs", include_in_schema=False)
@@ -112,15 +80,23 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists (instead of "*") let browsers cache preflights for max_age
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Accept",
+        "Authorization",
+        "Content-Type",
+        "X-Requested-With",
+        "X-Store-ID",
+        "X-Platform",
+        "X-Client-App",
+    ],
+    max_age=86400,
 )
 
-# Session Tracker Middleware
-app.add_middleware(SessionTrackerMiddleware)
-
-# Rate Limiter Middleware
-app.add_middleware(RateLimiterMiddleware)
+# Auth Context Middleware: decodes the token once, then applies rate limiting
+# and session tracking in the same pass (added last so it runs first)
+app.add_middleware(AuthContextMiddleware)
 
 
 # =============================================================================
@@ -131,10 +107,10 @@ app.add_middleware(RateLimiterMiddleware)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with detailed messages"""
     logger.error(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
-            "detail": exc.errors(),
+            "detail": jsonable_encoder(exc.errors()),
             "message": "Validation error occurred"
         },
     )
@@ -144,7 +120,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all uncaught exceptions"""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "message": "An internal server error occurred",
@@ -206,19 +182,26 @@ async def startup_event():
     logger.info(f"🚀 Starting {settings.PROJECT_NAME} v{settings.VERSION}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Supabase URL: {settings.SUPABASE_URL}")
+    cache_invalidation_listener.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
+    await session_writer.stop()
+    await audit_writer.stop()
+    await cache_invalidation_listener.stop()
 
 
 if __name__ == "__main__":
     import uvicorn
+    reload = settings.ENVIRONMENT == "development"
+    # Reload needs an import string; otherwise hand over this module's app so
+    # uvicorn does not import app.main a second time.
     uvicorn.run(
-        "app.main:app",
+        "app.main:app" if reload else app,
         host="0.0.0.0",
         port=8000,
-        reload=settings.ENVIRONMENT == "development"
+        reload=reload
     )
@@ -0,0 +1,63 @@
+"""
+Auth Context Middleware
+=======================
+Single per-request pass for authenticated traffic: decodes the bearer token
+once, stores the user on ``request.state.user`` for dependencies to reuse,
+applies role-based rate limiting and queues the session activity update.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.dependencies.auth import verify_token, user_from_payload
+from app.middleware.rate_limiter import check_rate_limit
+from app.middleware.session_tracker import track_session
+
+_BEARER_PREFIX = 'Bearer '
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+class AuthContextMiddleware:
+    """Pure ASGI middleware that resolves the authenticated user up front"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        auth_header = request.headers.get('Authorization')
+        payload = None
+        if auth_header and auth_header.startswith(_BEARER_PREFIX):
+            payload = verify_token(auth_header[_BEARER_PREFIX_LEN:])
+
+        if not payload or not payload.get('sub'):
+            await self.app(scope, receive, send)
+            return
+
+        user = user_from_payload(payload)
+        request.state.user = user
+
+        rejection, rate_headers = await check_rate_limit(scope['path'], user['id'])
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+
+        track_session(request, user['id'])
+
+        if not rate_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_rate_headers(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                for name, value in rate_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_headers)
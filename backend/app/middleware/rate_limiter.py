@@ -1,56 +1,126 @@
 """
-Rate Limiter Middleware
-=======================
+Rate Limiter
+============
 Role-based rate limiting using sliding window algorithm.
 Limits are configurable per-role via the admin settings.
+Applied per request by AuthContextMiddleware.
 """
 
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from fastapi import status
 from starlette.responses import Response, JSONResponse
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import logging
 import asyncio
+import time
 
 from app.services.supabase_client import supabase_client
+from app.services.role_service import RoleService
 
 logger = logging.getLogger(__name__)
 
 
 class RateLimitStore:
-    """In-memory sliding window rate limit store"""
+    """
+    In-memory sliding window rate limit store.
+    
+    Uses the sliding window counter approximation: per user we only keep the
+    request counts of the current and previous fixed windows, and estimate the
+    sliding count as ``previous * (1 - elapsed_fraction) + current``.
+    
+    No lock is needed: every update is a handful of integer operations with no
+    ``await`` in between, so it cannot interleave with other coroutines on the
+    event loop, and unrelated users never wait on each other.
+    
+    Entries are only rolled forward when their user makes a request, so a
+    background sweep drops users idle for over an hour (whose counters have
+    decayed to zero) to keep memory bounded by the active user count.
+    """
+    
+    MINUTE = 60
+    HOUR = 3600
+    SWEEP_INTERVAL = 300
     
     def __init__(self):
-        # Structure: {user_id: [(timestamp, count), ...]}
-        self.minute_requests: Dict[str, List[datetime]] = defaultdict(list)
-        self.hour_requests: Dict[str, List[datetime]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Structure: {user_id: [min_cur, min_prev, min_window, hr_cur, hr_prev, hr_window]}
+        self.windows: Dict[str, List[int]] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+    
+    def sweep(self) -> int:
+        """Drop users whose previous and current hour windows have both passed"""
+        current_hour = int(time.time()) // self.HOUR
+        idle = [
+            user_id for user_id, entry in self.windows.items()
+            if entry[5] < current_hour - 1
+        ]
+        for user_id in idle:
+            del self.windows[user_id]
+        return len(idle)
+    
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.SWEEP_INTERVAL)
+            removed = self.sweep()
+            if removed:
+                logger.debug("Rate limit store swept %d idle users", removed)
     
-    async def record_request(self, user_id: str) -> None:
-        """Record a request for a user"""
-        async with self._lock:
-            now = datetime.utcnow()
-            self.minute_requests[user_id].append(now)
-            self.hour_requests[user_id].append(now)
+    @staticmethod
+    def _roll(cur: int, prev: int, start: int, window: int) -> Tuple[int, int, int]:
+        """Advance a (current, previous, window id) triple to the given window id"""
+        if window == start:
+            return cur, prev, start
+        if window == start + 1:
+            return 0, cur, window
+        return 0, 0, window
+    
+    def _rolled(self, user_id: str, now: int) -> List[int]:
+        """Get the user's counters advanced to the windows containing ``now``"""
+        entry = self.windows.get(user_id)
+        min_window, hr_window = now // self.MINUTE, now // self.HOUR
+        if entry is None:
+            entry = [0, 0, min_window, 0, 0, hr_window]
+            self.windows[user_id] = entry
+            return entry
+        entry[0], entry[1], entry[2] = self._roll(entry[0], entry[1], entry[2], min_window)
+        entry[3], entry[4], entry[5] = self._roll(entry[3], entry[4], entry[5], hr_window)
+        return entry
+    
+    def _counts(self, entry: List[int], now: int) -> Tuple[int, int]:
+        """Approximate sliding minute/hour counts from rolled counters"""
+        minute_weight = 1 - (now % self.MINUTE) / self.MINUTE
+        hour_weight = 1 - (now % self.HOUR) / self.HOUR
+        return (
+            int(entry[1] * minute_weight + entry[0]),
+            int(entry[4] * hour_weight + entry[3]),
+        )
     
     async def get_request_counts(self, user_id: str) -> Tuple[int, int]:
-        """Get request counts for last minute and hour"""
-        async with self._lock:
-            now = datetime.utcnow()
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            
-            # Clean old entries and count
-            self.minute_requests[user_id] = [
-                ts for ts in self.minute_requests[user_id] if ts > minute_ago
-            ]
-            self.hour_requests[user_id] = [
-                ts for ts in self.hour_requests[user_id] if ts > hour_ago
-            ]
-            
-            return len(self.minute_requests[user_id]), len(self.hour_requests[user_id])
+        """Get (approximate sliding) request counts for last minute and hour"""
+        now = int(time.time())
+        return self._counts(self._rolled(user_id, now), now)
+    
+    async def check_and_record(
+        self, user_id: str, rpm_limit: int, rph_limit: int
+    ) -> Tuple[bool, int, int]:
+        """
+        Check the limits and record the request in one step.
+        
+        Returns:
+            (allowed, minute_count, hour_count) - counts include this request
+            when it was allowed; rejected requests are not recorded
+        """
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+        
+        now = int(time.time())
+        entry = self._rolled(user_id, now)
+        minute_count, hour_count = self._counts(entry, now)
+        
+        if minute_count >= rpm_limit or hour_count >= rph_limit:
+            return False, minute_count, hour_count
+        
+        entry[0] += 1
+        entry[3] += 1
+        return True, minute_count + 1, hour_count + 1
 
 
 class RateLimitConfigCache:
@@ -58,30 +128,61 @@ class RateLimitConfigCache:
     
     def __init__(self, ttl_seconds: int = 60):
         self.cache: Dict[int, dict] = {}
-        self.last_refresh: Optional[datetime] = None
-        self.ttl = timedelta(seconds=ttl_seconds)
+        # Best config per distinct set of role IDs, rebuilt after each refresh
+        self.best_by_roles: Dict[FrozenSet[int], Optional[dict]] = {}
+        # Monotonic timestamp of the last refresh (immune to wall-clock jumps)
+        self.last_refresh: Optional[float] = None
+        self.ttl = ttl_seconds
         self._lock = asyncio.Lock()
     
+    def _is_stale(self) -> bool:
+        return self.last_refresh is None or time.monotonic() - self.last_refresh > self.ttl
+    
+    async def _ensure_fresh(self) -> None:
+        """Refresh the cache if expired; the lock is only taken when a refresh is due"""
+        if self._is_stale():
+            async with self._lock:
+                if self._is_stale():
+                    await self._refresh_cache()
+    
     async def get_config(self, role_id: int) -> Optional[dict]:
         """Get rate limit config for a role"""
-        async with self._lock:
-            now = datetime.utcnow()
-            
-            # Refresh cache if expired
-            if self.last_refresh is None or now - self.last_refresh > self.ttl:
-                await self._refresh_cache()
-            
-            return self.cache.get(role_id)
+        await self._ensure_fresh()
+        return self.cache.get(role_id)
+    
+    async def get_best_config(self, role_ids: List[int]) -> Optional[dict]:
+        """Get the config with the highest requests_per_minute among the given roles"""
+        await self._ensure_fresh()
+        
+        key = frozenset(role_ids)
+        try:
+            return self.best_by_roles[key]
+        except KeyError:
+            pass
+        
+        best_config = None
+        best_rpm = 0
+        for role_id in key:
+            config = self.cache.get(role_id)
+            if config and config.get('requests_per_minute', 0) > best_rpm:
+                best_config = config
+                best_rpm = config.get('requests_per_minute', 0)
+        
+        self.best_by_roles[key] = best_config
+        return best_config
     
     async def _refresh_cache(self) -> None:
         """Refresh cache from database"""
         try:
-            response = supabase_client.table('rate_limit_configs').select('*').execute()
+            # Run the blocking HTTP call off the event loop
+            query = supabase_client.table('rate_limit_configs').select('*')
+            response = await asyncio.to_thread(query.execute)
             self.cache = {config['role_id']: config for config in response.data}
-            self.last_refresh = datetime.utcnow()
-            logger.debug(f"Rate limit cache refreshed: {len(self.cache)} configs")
+            self.best_by_roles = {}
+            self.last_refresh = time.monotonic()
+            logger.debug("Rate limit cache refreshed: %d configs", len(self.cache))
         except Exception as e:
-            logger.error(f"Failed to refresh rate limit cache: {e}")
+            logger.error("Failed to refresh rate limit cache: %s", e)
     
     def invalidate(self) -> None:
         """Invalidate cache to force refresh on next request"""
@@ -91,136 +192,97 @@ class RateLimitConfigCache:
 # Global instances
 rate_limit_store = RateLimitStore()
 rate_limit_config_cache = RateLimitConfigCache()
+_role_service = RoleService()
 
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
-    """Middleware for role-based rate limiting"""
+# Paths to exclude from rate limiting: exact matches plus prefixes
+# (so sub-paths like /docs/oauth2-redirect are covered too)
+EXCLUDED_PATHS = frozenset({'/'})
+EXCLUDED_PREFIXES = (
+    '/health',
+    '/docs',
+    '/redoc',
+    '/openapi.json',
+)
+
+
+def is_rate_limit_excluded(path: str) -> bool:
+    """Return True if the path is never rate limited"""
+    return path in EXCLUDED_PATHS or path.startswith(EXCLUDED_PREFIXES)
+
+
+async def _get_best_rate_limit(user_id: str) -> Optional[dict]:
+    """Get the highest enabled rate limit from the user's roles"""
+    # Get user's roles (cached per user, invalidated on role changes)
+    bundle = await _role_service.get_user_auth_bundle(user_id)
+    role_ids = [role['id'] for role in bundle['roles']]
+    if not role_ids:
+        return None
     
-    # Paths to exclude from rate limiting
-    EXCLUDED_PATHS = {
-        '/health',
-        '/docs',
-        '/redoc',
-        '/openapi.json',
-        '/',
-    }
+    config = await rate_limit_config_cache.get_best_config(role_ids)
+    if not config or not config.get('enabled', True):
+        return None
+    return config
+
+
+def _rate_limit_response(message: str, retry_after: int) -> JSONResponse:
+    """Return a 429 Too Many Requests response"""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "detail": message,
+            "retry_after": retry_after
+        },
+        headers={
+            "Retry-After": str(retry_after)
+        }
+    )
+
+
+async def check_rate_limit(
+    path: str, user_id: str
+) -> Tuple[Optional[Response], Dict[str, str]]:
+    """
+    Check and record a request against the user's role-based rate limit.
     
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        try:
-            # Skip excluded paths
-            if request.url.path in self.EXCLUDED_PATHS:
-                return await call_next(request)
-            
-            # Check for auth header
-            auth_header = request.headers.get('Authorization')
-            if not auth_header or not auth_header.startswith('Bearer '):
-                return await call_next(request)
-            
-            # Get user info from token
-            token = auth_header.replace('Bearer ', '')
-            user_info = await self._get_user_info(token)
-            
-            if not user_info:
-                return await call_next(request)
-            
-            user_id = user_info['user_id']
-            role_ids = user_info['role_ids']
-            
-            # Get rate limit config (use highest limit from user's roles)
-            config = await self._get_best_rate_limit(role_ids)
-            
-            if not config or not config.get('enabled', True):
-                return await call_next(request)
-            
-            # Check rate limits
-            minute_count, hour_count = await rate_limit_store.get_request_counts(user_id)
-            rpm_limit = config.get('requests_per_minute', 60)
-            rph_limit = config.get('requests_per_hour', 1000)
-            
-            # Check if over limit
+    Returns ``(rejection, headers)``: ``rejection`` is a 429 response when
+    the user is over a limit, otherwise None, and ``headers`` are the
+    X-RateLimit-* headers to add to the response. If the rate limiter
+    itself fails, the request is allowed through.
+    """
+    try:
+        if is_rate_limit_excluded(path):
+            return None, {}
+        
+        config = await _get_best_rate_limit(user_id)
+        if not config:
+            return None, {}
+        
+        # Check rate limits and record this request
+        rpm_limit = config.get('requests_per_minute', 60)
+        rph_limit = config.get('requests_per_hour', 1000)
+        allowed, minute_count, hour_count = await rate_limit_store.check_and_record(
+            user_id, rpm_limit, rph_limit
+        )
+        
+        if not allowed:
             if minute_count >= rpm_limit:
-                return self._rate_limit_response(
+                return _rate_limit_response(
                     f"Rate limit exceeded. Max {rpm_limit} requests per minute.",
                     retry_after=60
-                )
-            
-            if hour_count >= rph_limit:
-                return self._rate_limit_response(
-                    f"Rate limit exceeded. Max {rph_limit} requests per hour.",
-                    retry_after=3600
-                )
-            
-            # Record this request
-            await rate_limit_store.record_request(user_id)
-            
-            # Add rate limit headers to response
-            response = await call_next(request)
-            response.headers['X-RateLimit-Limit-Minute'] = str(rpm_limit)
-            response.headers['X-RateLimit-Limit-Hour'] = str(rph_limit)
-            response.headers['X-RateLimit-Remaining-Minute'] = str(max(0, rpm_limit - minute_count - 1))
-            response.headers['X-RateLimit-Remaining-Hour'] = str(max(0, rph_limit - hour_count - 1))
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"Rate limiter middleware processing error: {e}")
-            # If rate limiter itself fails, allow request through
-            return await call_next(request)
-    
-    async def _get_user_info(self, token: str) -> Optional[dict]:
-        """Get user ID and role IDs from token"""
-        try:
-            from jose import jwt
-            from app.config.settings import settings
-            
-            payload = jwt.decode(
-                token,
-                settings.SUPABASE_JWT_SECRET,
-                algorithms=["HS256"],
-                audience="authenticated"
-            )
-            
-            user_id = payload.get("sub")
-            if not user_id:
-                return None
-            
-            # Get user's roles
-            roles_response = supabase_client.table('user_roles').select('role_id').eq('user_id', user_id).execute()
-            role_ids = [r['role_id'] for r in roles_response.data] if roles_response.data else []
-            
-            return {'user_id': user_id, 'role_ids': role_ids}
-            
-        except Exception as e:
-            logger.debug(f"Could not get user info: {e}")
-            return None
-    
-    async def _get_best_rate_limit(self, role_ids: List[int]) -> Optional[dict]:
-        """Get the highest rate limit from user's roles"""
-        if not role_ids:
-            return None
-        
-        best_config = None
-        best_rpm = 0
+                ), {}
+            return _rate_limit_response(
+                f"Rate limit exceeded. Max {rph_limit} requests per hour.",
+                retry_after=3600
+            ), {}
         
-        for role_id in role_ids:
-            config = await rate_limit_config_cache.get_config(role_id)
-            if config and config.get('requests_per_minute', 0) > best_rpm:
-                best_config = config
-                best_rpm = config.get('requests_per_minute', 0)
-        
-        return best_config
+        return None, {
+            'X-RateLimit-Limit-Minute': str(rpm_limit),
+            'X-RateLimit-Limit-Hour': str(rph_limit),
+            'X-RateLimit-Remaining-Minute': str(max(0, rpm_limit - minute_count)),
+            'X-RateLimit-Remaining-Hour': str(max(0, rph_limit - hour_count)),
+        }
     
-    def _rate_limit_response(self, message: str, retry_after: int) -> JSONResponse:
-        """Return a 429 Too Many Requests response"""
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "detail": message,
-                "retry_after": retry_after
-            },
-            headers={
-                "Retry-After": str(retry_after)
-            }
-        )
+    except Exception as e:
+        logger.error("Rate limiter processing error: %s", e)
+        return None, {}
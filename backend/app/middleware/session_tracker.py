@@ -1,42 +1,87 @@
 """
-Session Tracker Middleware
-===========================
+Session Tracker
+===============
 Tracks user sessions with IP, user agent, and device information.
+Applied per request by AuthContextMiddleware.
 """
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+import hashlib
 import logging
+import re
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
-from app.services.supabase_client import supabase_client
+from typing import Dict, List
+from app.services.batch_writer import BatchWriter
+from app.services.supabase_client import supabase_client, execute_async
 
 logger = logging.getLogger(__name__)
 
+SESSION_LIFETIME = timedelta(days=30)
 
-def parse_user_agent(user_agent: str) -> dict:
-    """Simple user agent parser"""
-    ua_lower = user_agent.lower()
+# A session's activity is persisted at most once per interval; requests in
+# between only bump a timestamp in this map and never reach the database.
+SESSION_REFRESH_INTERVAL = 60
+RECENT_SESSIONS_MAXSIZE = 50_000
+_recent_sessions: Dict[bytes, float] = {}
+
+
+def _seen_recently(user_id: str, ip_address: str, user_agent: str) -> bool:
+    """Return True if this session was persisted within SESSION_REFRESH_INTERVAL, else mark it"""
+    key = hashlib.blake2b(
+        f"{user_id}\0{ip_address}\0{user_agent}".encode(), digest_size=16
+    ).digest()
+    now = time.monotonic()
     
-    # Detect device type
-    if 'mobile' in ua_lower or 'android' in ua_lower or 'iphone' in ua_lower:
-        device_type = 'Mobile'
-    elif 'tablet' in ua_lower or 'ipad' in ua_lower:
-        device_type = 'Tablet'
-    else:
-        device_type = 'Desktop'
+    last = _recent_sessions.get(key)
+    if last is not None and now - last < SESSION_REFRESH_INTERVAL:
+        return True
+    
+    if len(_recent_sessions) >= RECENT_SESSIONS_MAXSIZE:
+        _recent_sessions.pop(next(iter(_recent_sessions)), None)
+    _recent_sessions.pop(key, None)
+    _recent_sessions[key] = now
+    return False
+
+
+# Single pass over the UA string for every token the classifier needs
+_UA_TOKENS_RE = re.compile(
+    r'mobile|android|iphone|tablet|ipad|edg|crios|chrome|fxios|firefox|safari',
+    re.IGNORECASE,
+)
+
+# Classification tables, highest precedence first. Edge and Chrome UAs also
+# carry "safari" (and Edge carries "chrome"), so the more specific token wins;
+# crios/fxios are Chrome and Firefox on iOS.
+_DEVICE_PRECEDENCE = (
+    ('mobile', 'Mobile'),
+    ('android', 'Mobile'),
+    ('iphone', 'Mobile'),
+    ('tablet', 'Tablet'),
+    ('ipad', 'Tablet'),
+)
+_BROWSER_PRECEDENCE = (
+    ('edg', 'Edge'),
+    ('crios', 'Chrome'),
+    ('chrome', 'Chrome'),
+    ('fxios', 'Firefox'),
+    ('firefox', 'Firefox'),
+    ('safari', 'Safari'),
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_user_agent(user_agent: str) -> dict:
+    """Simple user agent parser (cached - the same UA strings repeat constantly)"""
+    tokens = {match.lower() for match in _UA_TOKENS_RE.findall(user_agent)}
     
-    # Detect browser
-    if 'chrome' in ua_lower and 'edg' not in ua_lower:
-        browser = 'Chrome'
-    elif 'firefox' in ua_lower:
-        browser = 'Firefox'
-    elif 'safari' in ua_lower and 'chrome' not in ua_lower:
-        browser = 'Safari'
-    elif 'edg' in ua_lower:
-        browser = 'Edge'
-    else:
-        browser = 'Unknown'
+    device_type = next(
+        (label for token, label in _DEVICE_PRECEDENCE if token in tokens), 'Desktop'
+    )
+    browser = next(
+        (label for token, label in _BROWSER_PRECEDENCE if token in tokens), 'Unknown'
+    )
     
     return {
         'device_type': device_type,
@@ -63,71 +108,51 @@ def get_client_ip(request: Request) -> str:
     return 'Unknown'
 
 
-class SessionTrackerMiddleware(BaseHTTPMiddleware):
-    """Middleware to track user sessions"""
-    
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        # Get response first
-        response = await call_next(request)
-        
-        # Only track for authenticated requests
-        try:
-            auth_header = request.headers.get('Authorization')
-            if not auth_header or not auth_header.startswith('Bearer '):
-                return response
-            
-            token = auth_header.replace('Bearer ', '')
-            
-            # Verify token and get user
-            from app.dependencies.auth import verify_token
-            payload = verify_token(token)
-            if not payload:
-                return response
-            
-            user_id = payload.get('sub')
-            if not user_id:
-                return response
-            
-            # Get client info
-            ip_address = get_client_ip(request)
-            user_agent = request.headers.get('User-Agent', 'Unknown')
-            ua_info = parse_user_agent(user_agent)
-            
-            # Update or insert session
-            try:
-                # Check if session exists
-                existing = supabase_client.table('user_sessions').select('id').eq(
-                    'user_id', user_id
-                ).eq('ip_address', ip_address).eq('user_agent', user_agent).execute()
-                
-                session_data = {
-                    'user_id': user_id,
-                    'ip_address': ip_address,
-                    'user_agent': user_agent,
-                    'device_type': ua_info['device_type'],
-                    'browser': ua_info['browser'],
-                    'last_activity_at': datetime.utcnow().isoformat(),
-                    'expires_at': (datetime.utcnow() + timedelta(days=30)).isoformat()
-                }
-                
-                if existing.data and len(existing.data) > 0:
-                    # Update existing session
-                    supabase_client.table('user_sessions').update({
-                        'last_activity_at': datetime.utcnow().isoformat(),
-                        'expires_at': (datetime.utcnow() + timedelta(days=30)).isoformat()
-                    }).eq('id', existing.data[0]['id']).execute()
-                else:
-                    # Insert new session
-                    supabase_client.table('user_sessions').insert(session_data).execute()
-                
-                logger.debug(f"Session tracked for user {user_id}: {ip_address} - {ua_info['device_type']}/{ua_info['browser']}")
-                
-            except Exception as e:
-                logger.debug(f"Could not track session: {e}")
-        
-        except Exception as e:
-            logger.debug(f"Session tracking error: {e}")
+async def _write_session_batch(batch: List[dict]) -> None:
+    """Upsert a batch of session rows, keeping the latest row per session"""
+    # Later rows win, so each session is written once with its latest activity
+    latest = {
+        (row['user_id'], row['ip_address'], row['user_agent']): row
+        for row in batch
+    }
+    try:
+        await execute_async(
+            supabase_client.table('user_sessions').upsert(
+                list(latest.values()), on_conflict='user_id,ip_address,user_agent'
+            )
+        )
+        logger.debug("Session batch written: %d sessions", len(latest))
+    except Exception as e:
+        logger.debug("Could not track sessions: %s", e)
+
+
+# Requests only enqueue their session row; rows are upserted in background
+# batches. When the queue is full the update is dropped - the next request
+# from that session will refresh it.
+session_writer = BatchWriter(_write_session_batch)
+
+
+def track_session(request: Request, user_id: str) -> None:
+    """Queue a session activity update for an authenticated request"""
+    try:
+        # Get client info
+        ip_address = get_client_ip(request)
+        user_agent = request.headers.get('User-Agent', 'Unknown')
+        if _seen_recently(user_id, ip_address, user_agent):
+            return
+        ua_info = parse_user_agent(user_agent)
         
-        return response
+        # Queue the session row; session_writer upserts it in the background
+        now = datetime.utcnow()
+        session_writer.enqueue({
+            'user_id': user_id,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'device_type': ua_info['device_type'],
+            'browser': ua_info['browser'],
+            'last_activity_at': now.isoformat(),
+            'expires_at': (now + SESSION_LIFETIME).isoformat()
+        })
+    
+    except Exception as e:
+        logger.debug("Session tracking error: %s", e)
@@ -1,34 +1,41 @@
 """Models module"""
-from app.models.user import (
-    UserBase,
-    UserCreate,
-    UserUpdate,
-    UserProfile,
-    UserWithRoles,
-    UserWithPermissions,
-    UserInDB
-)
-from app.models.role import (
-    RoleBase,
-    RoleCreate,
-    RoleUpdate,
-    Role,
-    RoleWithPermissions,
-    AssignRoleToUser
-)
-from app.models.permission import (
-    PermissionBase,
-    PermissionCreate,
-    PermissionUpdate,
-    Permission,
-    AssignPermissionToRole
-)
 
-__all__ = [
-    "UserBase", "UserCreate", "UserUpdate", "UserProfile", "UserWithRoles", 
-    "UserWithPermissions", "UserInDB",
-    "RoleBase", "RoleCreate", "RoleUpdate", "Role", "RoleWithPermissions", 
-    "AssignRoleToUser",
-    "PermissionBase", "PermissionCreate", "PermissionUpdate", "Permission",
-    "AssignPermissionToRole"
-]
+import importlib
+
+# Exported name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
+    "UserBase": ".user",
+    "UserCreate": ".user",
+    "UserUpdate": ".user",
+    "UserProfile": ".user",
+    "UserWithRoles": ".user",
+    "UserWithPermissions": ".user",
+    "UserInDB": ".user",
+    "RoleBase": ".role",
+    "RoleCreate": ".role",
+    "RoleUpdate": ".role",
+    "Role": ".role",
+    "RoleWithPermissions": ".role",
+    "AssignRoleToUser": ".role",
+    "PermissionBase": ".permission",
+    "PermissionCreate": ".permission",
+    "PermissionUpdate": ".permission",
+    "Permission": ".permission",
+    "AssignPermissionToRole": ".permission",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -8,7 +8,8 @@ Pydantic models for Business Management module including:
 - Daily Shop Prices
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+from pydantic.dataclasses import dataclass
 from typing import Optional, List
 from datetime import date, datetime
 from decimal import Decimal
@@ -45,8 +46,7 @@ class Shop(ShopBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -71,8 +71,7 @@ class ManagerDetails(ManagerDetailsBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ManagerWithProfile(BaseModel):
@@ -87,8 +86,7 @@ class ManagerWithProfile(BaseModel):
     shop_location: Optional[str] = None
     created_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UnassignedManager(BaseModel):
@@ -97,8 +95,7 @@ class UnassignedManager(BaseModel):
     email: str
     full_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserShop(BaseModel):
@@ -107,8 +104,7 @@ class UserShop(BaseModel):
     shop_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -120,7 +116,7 @@ class InventoryItemBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     sku: Optional[str] = Field(None, max_length=100)
     category: Optional[str] = Field(None, max_length=100)
-    base_price: Decimal = Field(..., ge=0, decimal_places=2)
+    base_price: Decimal = Field(..., ge=0, max_digits=10, decimal_places=2)
     unit: str = Field(default="piece", max_length=50)
     item_type: str = Field(default="sale", pattern="^(purchase|sale)$")
     is_active: bool = True
@@ -136,7 +132,7 @@ class InventoryItemUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     sku: Optional[str] = Field(None, max_length=100)
     category: Optional[str] = Field(None, max_length=100)
-    base_price: Optional[Decimal] = Field(None, ge=0, decimal_places=2)
+    base_price: Optional[Decimal] = Field(None, ge=0, max_digits=10, decimal_places=2)
     unit: Optional[str] = Field(None, max_length=50)
     item_type: Optional[str] = Field(None, pattern="^(purchase|sale)$")
     is_active: Optional[bool] = None
@@ -148,8 +144,7 @@ class InventoryItem(InventoryItemBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -161,7 +156,7 @@ class DailyPriceBase(BaseModel):
     shop_id: int
     item_id: int
     valid_date: date
-    price: Decimal = Field(..., ge=0, decimal_places=2)
+    price: Decimal = Field(..., ge=0, max_digits=10, decimal_places=2)
 
 
 class DailyPriceCreate(DailyPriceBase):
@@ -175,11 +170,14 @@ class DailyPrice(DailyPriceBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class DailyPriceWithItem(BaseModel):
+# Daily price rows travel in large lists, so they are slotted dataclasses
+# rather than BaseModels: no per-instance __dict__, same validation.
+
+@dataclass(slots=True, kw_only=True)
+class DailyPriceWithItem:
     """Daily price with item details"""
     item_id: int
     item_name: str
@@ -188,15 +186,13 @@ class DailyPriceWithItem(BaseModel):
     base_price: Decimal
     daily_price: Optional[Decimal] = None  # None means use base price
     unit: str
-    
-    class Config:
-        from_attributes = True
 
 
-class PriceItem(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PriceItem:
     """Single item in bulk update"""
     item_id: int
-    price: Decimal = Field(..., ge=0, decimal_places=2)
+    price: Decimal = Field(..., ge=0, max_digits=10, decimal_places=2)
 
 
 class BulkPriceUpdateRequest(BaseModel):
@@ -4,7 +4,7 @@ Permission Models
 Pydantic models for permission-related data validation and serialization.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -32,8 +32,7 @@ class Permission(PermissionBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AssignPermissionToRole(BaseModel):
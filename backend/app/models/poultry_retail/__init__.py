@@ -9,141 +9,87 @@ Complete poultry retail management system with:
 - Staff accountability and points system
 """
 
-from .enums import (
-    BirdType,
-    InventoryType,
-    VarianceType,
-    SettlementStatus,
-    PaymentMethod,
-    StoreStatus,
-    PurchaseStatus,
-    SaleType,
-    VarianceLogStatus,
-    SupplierStatus,
-    REASON_CODES
-)
+import importlib
 
-from .suppliers import (
-    SupplierBase,
-    SupplierCreate,
-    SupplierUpdate,
-    Supplier
-)
-
-from .purchases import (
-    PurchaseBase,
-    PurchaseCreate,
-    PurchaseCommit,
-    Purchase,
-    PurchaseWithSupplier
-)
-
-from .inventory import (
-    InventoryLedgerEntry,
-    CurrentStock,
-    StockSummary,
-    WastageConfig,
-    WastageConfigCreate,
-    ProcessingEntryCreate,
-    ProcessingEntry,
-    ProcessingCalculation
-)
-
-from .skus import (
-    SKUBase,
-    SKUCreate,
-    SKUUpdate,
-    SKU,
-    StorePriceCreate,
-    StorePrice,
-    SKUWithPrice
-)
-
-from .sales import (
-    SaleItemCreate,
-    SaleCreate,
-    SaleItem,
-    Sale,
-    SaleWithItems
-)
-
-from .settlements import (
-    DeclaredStock,
-    SettlementCreate,
-    SettlementSubmit,
-    Settlement,
-    SettlementWithVariance
-)
-
-from .variance import (
-    VarianceLog,
-    VarianceApproval
-)
-
-from .staff_points import (
-    StaffPointEntry,
-    StaffPointSummary,
-    StaffPointsConfig
-)
-
-__all__ = [
+# Exported name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing the package stays cheap.
+_LAZY = {
     # Enums
-    "BirdType",
-    "InventoryType",
-    "VarianceType",
-    "SettlementStatus",
-    "PaymentMethod",
-    "StoreStatus",
-    "PurchaseStatus",
-    "SaleType",
-    "VarianceLogStatus",
-    "SupplierStatus",
-    "REASON_CODES",
+    "BirdType": ".enums",
+    "InventoryType": ".enums",
+    "VarianceType": ".enums",
+    "SettlementStatus": ".enums",
+    "PaymentMethod": ".enums",
+    "LedgerPaymentMethod": ".enums",
+    "StoreStatus": ".enums",
+    "PurchaseStatus": ".enums",
+    "SaleType": ".enums",
+    "VarianceLogStatus": ".enums",
+    "SupplierStatus": ".enums",
+    "LedgerEntityType": ".enums",
+    "LedgerTransactionType": ".enums",
+    "REASON_CODES": ".enums",
     # Suppliers
-    "SupplierBase",
-    "SupplierCreate",
-    "SupplierUpdate",
-    "Supplier",
+    "SupplierBase": ".suppliers",
+    "SupplierCreate": ".suppliers",
+    "SupplierUpdate": ".suppliers",
+    "Supplier": ".suppliers",
     # Purchases
-    "PurchaseBase",
-    "PurchaseCreate",
-    "PurchaseCommit",
-    "Purchase",
-    "PurchaseWithSupplier",
+    "PurchaseBase": ".purchases",
+    "PurchaseCreate": ".purchases",
+    "PurchaseCommit": ".purchases",
+    "Purchase": ".purchases",
+    "PurchaseWithSupplier": ".purchases",
     # Inventory
-    "InventoryLedgerEntry",
-    "CurrentStock",
-    "StockSummary",
-    "WastageConfig",
-    "WastageConfigCreate",
-    "ProcessingEntryCreate",
-    "ProcessingEntry",
-    "ProcessingCalculation",
+    "InventoryLedgerEntry": ".inventory",
+    "InventoryLedgerBulkCreate": ".inventory",
+    "CurrentStock": ".inventory",
+    "StockSummary": ".inventory",
+    "WastageConfig": ".inventory",
+    "WastageConfigCreate": ".inventory",
+    "ProcessingEntryCreate": ".inventory",
+    "ProcessingEntry": ".inventory",
+    "ProcessingCalculation": ".inventory",
     # SKUs
-    "SKUBase",
-    "SKUCreate",
-    "SKUUpdate",
-    "SKU",
-    "StorePriceCreate",
-    "StorePrice",
-    "SKUWithPrice",
+    "SKUBase": ".skus",
+    "SKUCreate": ".skus",
+    "SKUUpdate": ".skus",
+    "SKU": ".skus",
+    "StorePriceCreate": ".skus",
+    "StorePrice": ".skus",
+    "SKUWithPrice": ".skus",
     # Sales
-    "SaleItemCreate",
-    "SaleCreate",
-    "SaleItem",
-    "Sale",
-    "SaleWithItems",
+    "SaleItemCreate": ".sales",
+    "SaleCreate": ".sales",
+    "SaleItem": ".sales",
+    "Sale": ".sales",
+    "SaleWithItems": ".sales",
     # Settlements
-    "DeclaredStock",
-    "SettlementCreate",
-    "SettlementSubmit",
-    "Settlement",
-    "SettlementWithVariance",
+    "DeclaredStock": ".settlements",
+    "SettlementCreate": ".settlements",
+    "SettlementSubmit": ".settlements",
+    "Settlement": ".settlements",
+    "SettlementWithVariance": ".settlements",
     # Variance
-    "VarianceLog",
-    "VarianceApproval",
+    "VarianceLog": ".variance",
+    "VarianceApproval": ".variance",
     # Staff Points
-    "StaffPointEntry",
-    "StaffPointSummary",
-    "StaffPointsConfig",
-]
+    "StaffPointEntry": ".staff_points",
+    "StaffPointSummary": ".staff_points",
+    "StaffPointsConfig": ".staff_points",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,13 +4,15 @@ Customer Models for PoultryRetail-Core
 Pydantic models for customer management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
 from enum import Enum
 
+from .identifiers import PhoneStr
+
 
 class CustomerStatus(str, Enum):
     ACTIVE = "ACTIVE"
@@ -31,13 +33,13 @@ class CustomerBase(BaseModel):
 
 class CustomerCreate(CustomerBase):
     """Model for creating a new customer"""
-    pass
+    phone: Optional[PhoneStr] = None
 
 
 class CustomerUpdate(BaseModel):
     """Model for updating customer details"""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
-    phone: Optional[str] = Field(None, max_length=20)
+    phone: Optional[PhoneStr] = None
     email: Optional[str] = Field(None, max_length=255)
     address: Optional[str] = None
     gstin: Optional[str] = Field(None, max_length=20)
@@ -54,8 +56,7 @@ class Customer(CustomerBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CustomerWithBalance(Customer):
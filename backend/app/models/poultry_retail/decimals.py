@@ -0,0 +1,58 @@
+"""
+Decimal Coercion for PoultryRetail-Core
+=======================================
+Shared before-validation helpers for models with Decimal fields, plus
+integer-gram helpers for summing kilogram weights.
+"""
+
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+
+
+def to_decimal(value: Any, empty: Optional[Decimal] = None) -> Optional[Decimal]:
+    """Convert a raw value to Decimal, skipping work when it already is one"""
+    if isinstance(value, Decimal):
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    if value is None or value == "":
+        return empty
+    return Decimal(str(value))
+
+
+def decimalize(data: Any, fields: Tuple[str, ...], empty: Optional[Decimal] = None) -> Any:
+    """
+    Coerce the given raw input fields to Decimal in a single pass.
+
+    Floats go through ``str()`` so they keep their shortest repr
+    (1.1 -> Decimal('1.1')); None and "" become ``empty``. Non-dict input
+    (e.g. ORM objects under from_attributes) is returned untouched.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    data = dict(data)
+    for field in fields:
+        if field in data:
+            data[field] = to_decimal(data[field], empty)
+    return data
+
+
+def to_grams(value: Any) -> int:
+    """
+    Quantize a kilogram weight (3 decimal places) to integer grams.
+
+    Aggregations add up grams as native ints and convert back with
+    ``from_grams`` once per output value, instead of building a Decimal for
+    every row. None and "" count as zero.
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, Decimal):
+        return int((value * 1000).to_integral_value())
+    return round(float(value) * 1000)
+
+
+def from_grams(grams: int) -> Decimal:
+    """Convert integer grams back to a kilogram Decimal (1234 -> Decimal('1.234'))"""
+    return Decimal(grams).scaleb(-3)
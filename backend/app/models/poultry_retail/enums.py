@@ -5,6 +5,7 @@ Immutable system constants used across all modules.
 """
 
 from enum import Enum
+from types import MappingProxyType
 
 
 class BirdType(str, Enum):
@@ -51,6 +52,15 @@ class PaymentMethod(str, Enum):
     CREDIT = "CREDIT"
 
 
+class LedgerPaymentMethod(str, Enum):
+    """Payment methods for customer receipts and supplier payments"""
+    CASH = "CASH"
+    BANK = "BANK"
+    UPI = "UPI"
+    CHEQUE = "CHEQUE"
+    OTHER = "OTHER"
+
+
 class StoreStatus(str, Enum):
     """Store operational status"""
     ACTIVE = "ACTIVE"       # Normal operations
@@ -83,10 +93,24 @@ class SupplierStatus(str, Enum):
     INACTIVE = "INACTIVE"
 
 
+class LedgerEntityType(str, Enum):
+    """Counterparty of a financial ledger entry"""
+    CUSTOMER = "CUSTOMER"
+    SUPPLIER = "SUPPLIER"
+
+
+class LedgerTransactionType(str, Enum):
+    """Source transaction of a financial ledger entry"""
+    SALE = "SALE"
+    RECEIPT = "RECEIPT"
+    PURCHASE = "PURCHASE"
+    SUPPLIER_PAYMENT = "SUPPLIER_PAYMENT"
+
+
 # =============================================================================
 # REASON CODES FOR INVENTORY LEDGER
 # =============================================================================
-REASON_CODES = {
+_REASON_CODES = {
     "PURCHASE_RECEIVED": {
         "description": "Live birds received from supplier",
         "direction": "CREDIT",
@@ -139,6 +163,11 @@ REASON_CODES = {
     }
 }
 
+# Read-only view so the shared constant cannot be mutated at runtime
+REASON_CODES = MappingProxyType({
+    code: MappingProxyType(info) for code, info in _REASON_CODES.items()
+})
+
 
 # =============================================================================
 # STAFF POINTS CONFIGURATION KEYS
@@ -0,0 +1,34 @@
+"""
+Identifier Types for PoultryRetail-Core
+=======================================
+Constrained string types checked entirely in pydantic-core: UUIDs for read
+models that only pass ids through, and phone/reference inputs.
+"""
+
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field, StringConstraints
+
+# Canonical hyphenated UUID as returned by PostgREST. Validated by a Rust
+# regex in pydantic-core and serialized as-is, with no uuid.UUID round trip.
+UUIDStr = Annotated[
+    str,
+    StringConstraints(
+        pattern=r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+    ),
+    Field(json_schema_extra={'format': 'uuid'}),
+]
+
+
+def as_uuid(value: str) -> UUID:
+    """Parse a UUIDStr where UUID semantics (comparison, hashing) are needed"""
+    return UUID(value)
+
+
+# Phone number input: digits with optional leading +, spaces, dashes and
+# parentheses. Empty strings are allowed since forms send "" for no phone.
+PhoneStr = Annotated[str, StringConstraints(max_length=20, pattern=r'^(\+?[0-9 ()-]{7,20})?$')]
+
+# Invoice / payment reference number input: free text without control characters
+ReferenceStr = Annotated[str, StringConstraints(max_length=100, pattern=r'^[^\x00-\x1f\x7f]*$')]
@@ -4,13 +4,15 @@ Inventory Models for PoultryRetail-Core
 Pydantic models for inventory ledger, stock, wastage, and processing.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator, field_validator, field_serializer, ConfigDict
 from typing import Optional, Dict
 from datetime import datetime, date
 from decimal import Decimal
 from uuid import UUID
 
 from .enums import BirdType, InventoryType
+from .decimals import decimalize
+from .identifiers import UUIDStr
 
 
 # =============================================================================
@@ -19,7 +21,7 @@ from .enums import BirdType, InventoryType
 
 class InventoryLedgerEntry(BaseModel):
     """Inventory ledger entry (append-only record)"""
-    id: UUID
+    id: UUIDStr
     store_id: int
     bird_type: BirdType
     inventory_type: InventoryType
@@ -28,15 +30,14 @@ class InventoryLedgerEntry(BaseModel):
     reason_code: str
     new_quantity: Optional[Decimal] = None
     sku_name: Optional[str] = None
-    sku_id: Optional[UUID] = None
-    ref_id: Optional[UUID] = None
+    sku_id: Optional[UUIDStr] = None
+    ref_id: Optional[UUIDStr] = None
     ref_type: Optional[str] = None
-    user_id: UUID
+    user_id: UUIDStr
     notes: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class InventoryLedgerCreate(BaseModel):
@@ -51,12 +52,15 @@ class InventoryLedgerCreate(BaseModel):
     reason_code: str
     notes: Optional[str] = None
 
-    @field_validator('quantity_change', 'absolute_quantity', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None and v != "":
-            return Decimal(str(v))
-        return None
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('quantity_change', 'absolute_quantity'))
+
+
+class InventoryLedgerBulkCreate(BaseModel):
+    """Model for appending a batch of ledger entries (e.g. bulk bird receipts)"""
+    entries: list[InventoryLedgerCreate] = Field(..., min_length=1, max_length=1000)
 
 
 # =============================================================================
@@ -72,8 +76,7 @@ class CurrentStock(BaseModel):
     current_bird_count: int = 0
     last_updated: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StockByType(BaseModel):
@@ -83,17 +86,14 @@ class StockByType(BaseModel):
     SKIN: Decimal = Decimal("0.000")
     SKINLESS: Decimal = Decimal("0.000")
 
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v)
-        }
+    @field_serializer('LIVE', 'SKIN', 'SKINLESS', when_used='json')
+    def serialize_decimal(self, v: Decimal) -> float:
+        return float(v)
 
+    @model_validator(mode='before')
     @classmethod
-    @field_validator('LIVE', 'SKIN', 'SKINLESS', mode='before')
-    def convert_to_decimal(cls, v):
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('LIVE', 'SKIN', 'SKINLESS'))
 
 
 class StockSummary(BaseModel):
@@ -116,12 +116,10 @@ class WastageConfigBase(BaseModel):
     effective_date: date
     is_active: bool = True
 
-    @field_validator('percentage', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('percentage',))
 
 
 class WastageConfigCreate(WastageConfigBase):
@@ -135,8 +133,7 @@ class WastageConfig(WastageConfigBase):
     created_by: Optional[UUID] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -150,6 +147,8 @@ class ProcessingCalculation(BaseModel):
     wastage_weight: Decimal
     output_weight: Decimal
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ProcessingEntryCreate(BaseModel):
     """Model for creating a processing entry"""
@@ -162,12 +161,10 @@ class ProcessingEntryCreate(BaseModel):
     actual_output_weight: Optional[Decimal] = Field(None, gt=0, max_digits=10, decimal_places=3)
     idempotency_key: Optional[UUID] = None
 
-    @field_validator('input_weight', 'actual_output_weight', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('input_weight', 'actual_output_weight'))
 
     @field_validator('output_inventory_type')
     @classmethod
@@ -194,8 +191,7 @@ class ProcessingEntry(BaseModel):
     processed_by: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ProcessingListResponse(BaseModel):
@@ -4,36 +4,40 @@ Financial Ledger Models for PoultryRetail-Core
 Pydantic models for the customer and supplier financial ledger.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
+from .enums import LedgerEntityType, LedgerTransactionType
+from .identifiers import UUIDStr
+
 
 class FinancialLedgerEntry(BaseModel):
     """Financial ledger entry (Double-entry transaction)"""
-    id: UUID
+    id: UUIDStr
     store_id: Optional[int] = None
-    entity_type: str  # 'CUSTOMER' or 'SUPPLIER'
-    entity_id: UUID
-    transaction_type: str  # 'SALE', 'RECEIPT', 'PURCHASE', 'SUPPLIER_PAYMENT'
+    entity_type: LedgerEntityType
+    entity_id: UUIDStr
+    transaction_type: LedgerTransactionType
     debit: Decimal = Decimal("0")
     credit: Decimal = Decimal("0")
     ref_table: Optional[str] = None
-    ref_id: Optional[UUID] = None
+    ref_id: Optional[UUIDStr] = None
     notes: Optional[str] = None
-    created_by: Optional[UUID] = None
+    created_by: Optional[UUIDStr] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LedgerSummary(BaseModel):
     """Calculated summary of ledger for an entity"""
     entity_id: UUID
-    entity_type: str
+    entity_type: LedgerEntityType
     total_debit: Decimal
     total_credit: Decimal
     outstanding: Decimal
+
+    model_config = ConfigDict(frozen=True)
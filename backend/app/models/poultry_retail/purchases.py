@@ -4,13 +4,15 @@ Purchase Models for PoultryRetail-Core
 Pydantic models for purchase order management.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional
 from datetime import datetime, date
 from decimal import Decimal
 from uuid import UUID
 
 from .enums import BirdType, PurchaseStatus
+from .decimals import decimalize
+from .identifiers import ReferenceStr
 
 
 class PurchaseBase(BaseModel):
@@ -25,17 +27,15 @@ class PurchaseBase(BaseModel):
     invoice_date: Optional[date] = None
     notes: Optional[str] = None
 
-    @field_validator('total_weight', 'price_per_kg', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('total_weight', 'price_per_kg'))
 
 
 class PurchaseCreate(PurchaseBase):
     """Model for creating a new purchase order"""
-    pass
+    invoice_number: Optional[ReferenceStr] = None
 
 
 class PurchaseCommit(BaseModel):
@@ -46,7 +46,7 @@ class PurchaseCommit(BaseModel):
 class Purchase(PurchaseBase):
     """Complete purchase model with computed and audit fields"""
     id: UUID
-    total_amount: Decimal  # Computed: total_weight * price_per_kg
+    total_amount: Decimal  # Generated column in SQL: total_weight * price_per_kg
     status: PurchaseStatus = PurchaseStatus.DRAFT
     created_by: UUID
     committed_by: Optional[UUID] = None
@@ -54,8 +54,7 @@ class Purchase(PurchaseBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PurchaseWithSupplier(Purchase):
@@ -63,8 +62,7 @@ class PurchaseWithSupplier(Purchase):
     supplier_name: str
     supplier_contact: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PurchaseListResponse(BaseModel):
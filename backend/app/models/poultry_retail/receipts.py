@@ -4,20 +4,14 @@ Receipt Models for PoultryRetail-Core
 Pydantic models for receipt (customer payment) management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
-from enum import Enum
 
-
-class PaymentMethod(str, Enum):
-    CASH = "CASH"
-    BANK = "BANK"
-    UPI = "UPI"
-    CHEQUE = "CHEQUE"
-    OTHER = "OTHER"
+from .enums import LedgerPaymentMethod
+from .identifiers import ReferenceStr
 
 
 class ReceiptBase(BaseModel):
@@ -25,7 +19,7 @@ class ReceiptBase(BaseModel):
     sale_id: Optional[UUID] = None
     customer_id: UUID
     amount: Decimal = Field(..., gt=0)
-    payment_method: PaymentMethod
+    payment_method: LedgerPaymentMethod
     reference_number: Optional[str] = Field(None, max_length=100)
     receipt_date: Optional[datetime] = None
     notes: Optional[str] = None
@@ -33,7 +27,7 @@ class ReceiptBase(BaseModel):
 
 class ReceiptCreate(ReceiptBase):
     """Model for creating a new receipt"""
-    pass
+    reference_number: Optional[ReferenceStr] = None
 
 
 class Receipt(ReceiptBase):
@@ -44,8 +38,7 @@ class Receipt(ReceiptBase):
     created_by: Optional[UUID] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ReceiptWithDetails(Receipt):
@@ -4,13 +4,15 @@ Sales Models for PoultryRetail-Core
 Pydantic models for POS and bulk sales.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
 from .enums import PaymentMethod, SaleType
+from .decimals import decimalize
+from .identifiers import UUIDStr, PhoneStr
 
 
 # =============================================================================
@@ -23,25 +25,22 @@ class SaleItemCreate(BaseModel):
     weight: Decimal = Field(..., gt=0, max_digits=10, decimal_places=3)
     price_snapshot: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
 
-    @field_validator('weight', 'price_snapshot', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('weight', 'price_snapshot'))
 
 
 class SaleItem(BaseModel):
     """Complete sale item model"""
-    id: UUID
-    sale_id: UUID
-    sku_id: UUID
+    id: UUIDStr
+    sale_id: UUIDStr
+    sku_id: UUIDStr
     weight: Decimal
     price_snapshot: Decimal
-    total: Decimal  # Computed: weight * price_snapshot
+    total: Decimal  # Generated column in SQL: weight * price_snapshot
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SaleItemWithSKU(SaleItem):
@@ -50,8 +49,7 @@ class SaleItemWithSKU(SaleItem):
     sku_code: str
     unit: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -61,49 +59,40 @@ class SaleItemWithSKU(SaleItem):
 class SaleCreate(BaseModel):
     """Model for creating a new sale"""
     store_id: int
-    items: list[SaleItemCreate]
+    items: list[SaleItemCreate] = Field(..., min_length=1, max_length=500)
     payment_method: PaymentMethod
     sale_type: SaleType = SaleType.POS
     customer_id: Optional[UUID] = None
     customer_name: Optional[str] = Field(None, max_length=255)
-    customer_phone: Optional[str] = Field(None, max_length=20)
+    customer_phone: Optional[PhoneStr] = None
     notes: Optional[str] = None
     idempotency_key: Optional[UUID] = None
 
-    @field_validator('items')
-    @classmethod
-    def at_least_one_item(cls, v):
-        if not v or len(v) == 0:
-            raise ValueError("Sale must have at least one item")
-        return v
-
 
 class Sale(BaseModel):
     """Complete sale model"""
-    id: UUID
+    id: UUIDStr
     store_id: int
-    cashier_id: UUID
+    cashier_id: UUIDStr
     total_amount: Decimal
     payment_method: PaymentMethod
     sale_type: SaleType
     receipt_number: str
-    customer_id: Optional[UUID] = None
+    customer_id: Optional[UUIDStr] = None
     customer_name: Optional[str] = None
     customer_phone: Optional[str] = None
     payment_status: Optional[str] = None
     notes: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SaleWithItems(Sale):
     """Sale with all items"""
     items: list[SaleItemWithSKU]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SaleListResponse(BaseModel):
@@ -4,13 +4,14 @@ Settlement Models for PoultryRetail-Core
 Pydantic models for daily settlements and variance detection.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime, date
 from decimal import Decimal
 from uuid import UUID
 
 from .enums import SettlementStatus, ExpenseStatus, BirdType, InventoryType
+from .decimals import decimalize
 
 
 class SettlementReject(BaseModel):
@@ -29,12 +30,10 @@ class InventoryTypeStock(BaseModel):
     SKIN: Decimal = Field(default=Decimal("0.000"), ge=0)
     SKINLESS: Decimal = Field(default=Decimal("0.000"), ge=0)
 
-    @field_validator('LIVE', 'SKIN', 'SKINLESS', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return Decimal("0.000")
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('LIVE', 'SKIN', 'SKINLESS'), empty=Decimal("0.000"))
 
 
 class DeclaredStock(BaseModel):
@@ -54,6 +53,8 @@ class VarianceDetail(BaseModel):
     variance: Decimal
     type: str  # "POSITIVE", "NEGATIVE", or "ZERO"
 
+    model_config = ConfigDict(frozen=True)
+
 
 class VarianceByType(BaseModel):
     """Variance breakdown by inventory type"""
@@ -61,12 +62,16 @@ class VarianceByType(BaseModel):
     SKIN: Optional[VarianceDetail] = None
     SKINLESS: Optional[VarianceDetail] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CalculatedVariance(BaseModel):
     """Complete calculated variance"""
     BROILER: VarianceByType = VarianceByType()
     PARENT_CULL: VarianceByType = VarianceByType()
 
+    model_config = ConfigDict(frozen=True)
+
 
 # =============================================================================
 # SETTLEMENT MODELS
@@ -91,13 +96,14 @@ class SettlementSubmit(BaseModel):
     expense_status: Optional[ExpenseStatus] = ExpenseStatus.SUBMITTED
     settlement_date: Optional[date] = None
 
-    @field_validator('declared_cash', 'declared_upi', 'declared_card', 
-                     'declared_bank', 'expense_amount', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return Decimal("0.00")
+    def coerce_decimals(cls, data):
+        return decimalize(
+            data,
+            ('declared_cash', 'declared_upi', 'declared_card', 'declared_bank', 'expense_amount'),
+            empty=Decimal("0.00"),
+        )
 
 
 class Settlement(BaseModel):
@@ -112,14 +118,15 @@ class Settlement(BaseModel):
     declared_card: Decimal
     declared_bank: Decimal
     
-    # Stock declarations (JSON in DB)
+    # Stock declarations (JSONB written from DeclaredStock, echoed as stored;
+    # drafts hold '{}' and older rows may predate the DeclaredStock checks)
     declared_stock: Dict[str, Any]
     
-    # Expected values (calculated)
+    # Expected values (calculated in SQL)
     expected_sales: Dict[str, Any]
     expected_stock: Dict[str, Any]
     
-    # Variance
+    # Variance (shape set by calculate_settlement_variance; LIVE carries counts)
     calculated_variance: Dict[str, Any]
     
     # Expenses
@@ -141,8 +148,7 @@ class Settlement(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SettlementWithVariance(Settlement):
@@ -152,8 +158,7 @@ class SettlementWithVariance(Settlement):
     negative_variance_count: int = 0
     has_pending_variances: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SettlementListResponse(BaseModel):
@@ -4,13 +4,14 @@ SKU and Pricing Models for PoultryRetail-Core
 Pydantic models for SKUs and store-specific pricing.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional
 from datetime import datetime, date
 from decimal import Decimal
 from uuid import UUID
 
 from .enums import BirdType, InventoryType
+from .decimals import decimalize
 
 
 # =============================================================================
@@ -47,8 +48,7 @@ class SKU(SKUBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -62,12 +62,10 @@ class StorePriceBase(BaseModel):
     price: Decimal = Field(..., gt=0, max_digits=12, decimal_places=2)
     effective_date: date
 
-    @field_validator('price', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
+    def coerce_decimals(cls, data):
+        return decimalize(data, ('price',))
 
 
 class StorePriceCreate(StorePriceBase):
@@ -88,8 +86,7 @@ class StorePrice(StorePriceBase):
     created_by: Optional[UUID] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SKUWithPrice(BaseModel):
@@ -104,8 +101,7 @@ class SKUWithPrice(BaseModel):
     current_price: Optional[Decimal] = None
     effective_date: Optional[date] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StorePriceListResponse(BaseModel):
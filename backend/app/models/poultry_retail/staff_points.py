@@ -4,7 +4,7 @@ Staff Points Models for PoultryRetail-Core
 Pydantic models for staff performance tracking and incentives.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime, date
 from uuid import UUID
@@ -24,8 +24,7 @@ class StaffPointEntry(BaseModel):
     created_by: Optional[UUID] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class StaffPointEntryWithUser(StaffPointEntry):
@@ -33,8 +32,7 @@ class StaffPointEntryWithUser(StaffPointEntry):
     user_email: str
     user_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StaffPointsCreate(BaseModel):
@@ -68,6 +66,8 @@ class StaffVarianceSummary(BaseModel):
     negative_kg: float
     count: int
 
+    model_config = ConfigDict(frozen=True)
+
 class StaffPerformanceBreakdown(BaseModel):
     user_id: UUID
     total_points: int
@@ -87,8 +87,7 @@ class StaffPointsConfig(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StaffPointsConfigUpdate(BaseModel):
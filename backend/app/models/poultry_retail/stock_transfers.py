@@ -4,13 +4,15 @@ Stock Transfer Models for PoultryRetail-Core
 Pydantic models for inter-store stock transfers.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import date, datetime
 from decimal import Decimal
-from uuid import UUID
 from enum import Enum
 
+from .enums import BirdType, InventoryType
+from .identifiers import UUIDStr
+
 
 class TransferStatus(str, Enum):
     """Transfer workflow statuses."""
@@ -24,38 +26,17 @@ class StockTransferCreate(BaseModel):
     """Model for creating a new stock transfer."""
     from_store_id: int = Field(..., description="Source store ID")
     to_store_id: int = Field(..., description="Destination store ID")
-    bird_type: str = Field(..., description="BROILER or PARENT_CULL")
-    inventory_type: str = Field(..., description="LIVE, SKIN, or SKINLESS")
+    bird_type: BirdType = Field(..., description="BROILER or PARENT_CULL")
+    inventory_type: InventoryType = Field(..., description="LIVE, SKIN, or SKINLESS")
     weight_kg: Decimal = Field(..., gt=0, description="Weight in kg")
     bird_count: Optional[int] = Field(default=0, ge=0, description="Number of birds (for LIVE)")
     transfer_date: Optional[date] = Field(default=None, description="Transfer date (default: today)")
     notes: Optional[str] = Field(default=None, max_length=500)
 
-    @field_validator('weight_kg', mode='before')
-    @classmethod
-    def convert_weight(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
-
-    @field_validator('bird_type')
-    @classmethod
-    def validate_bird_type(cls, v):
-        if v not in ['BROILER', 'PARENT_CULL']:
-            raise ValueError('bird_type must be BROILER or PARENT_CULL')
-        return v
-
-    @field_validator('inventory_type')
-    @classmethod
-    def validate_inventory_type(cls, v):
-        if v not in ['LIVE', 'SKIN', 'SKINLESS']:
-            raise ValueError('inventory_type must be LIVE, SKIN, or SKINLESS')
-        return v
-
 
 class StockTransfer(BaseModel):
     """Complete stock transfer model."""
-    id: UUID
+    id: UUIDStr
     from_store_id: int
     to_store_id: int
     bird_type: str
@@ -64,9 +45,9 @@ class StockTransfer(BaseModel):
     bird_count: int = 0
     transfer_date: date
     status: TransferStatus
-    initiated_by: Optional[UUID] = None
-    received_by: Optional[UUID] = None
-    approved_by: Optional[UUID] = None
+    initiated_by: Optional[UUIDStr] = None
+    received_by: Optional[UUIDStr] = None
+    approved_by: Optional[UUIDStr] = None
     received_at: Optional[datetime] = None
     approved_at: Optional[datetime] = None
     notes: Optional[str] = None
@@ -74,15 +55,7 @@ class StockTransfer(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
-    @classmethod
-    @field_validator('weight_kg', mode='before')
-    def convert_to_decimal(cls, v):
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class StockTransferWithStores(StockTransfer):
@@ -93,20 +66,21 @@ class StockTransferWithStores(StockTransfer):
     received_by_name: Optional[str] = None
     approved_by_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class TransferReceive(BaseModel):
     """Model for receiving a transfer."""
-    pass  # No additional data needed
+    # No additional data needed; only built if it is ever validated
+    model_config = ConfigDict(defer_build=True)
 
 
 class TransferApprove(BaseModel):
     """Model for approving a transfer."""
-    pass  # No additional data needed
+    # No additional data needed; only built if it is ever validated
+    model_config = ConfigDict(defer_build=True)
 
 
 class TransferReject(BaseModel):
     """Model for rejecting a transfer."""
     rejection_reason: Optional[str] = Field(default=None, max_length=500)
+
+    model_config = ConfigDict(defer_build=True)
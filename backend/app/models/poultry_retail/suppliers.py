@@ -4,12 +4,12 @@ Supplier Models for PoultryRetail-Core
 Pydantic models for supplier management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
-from uuid import UUID
 
 from .enums import SupplierStatus
+from .identifiers import UUIDStr, PhoneStr
 
 
 class SupplierBase(BaseModel):
@@ -25,13 +25,13 @@ class SupplierBase(BaseModel):
 
 class SupplierCreate(SupplierBase):
     """Model for creating a new supplier"""
-    pass
+    phone: Optional[PhoneStr] = None
 
 
 class SupplierUpdate(BaseModel):
     """Model for updating supplier details"""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
-    phone: Optional[str] = Field(None, max_length=20)
+    phone: Optional[PhoneStr] = None
     email: Optional[str] = Field(None, max_length=255)
     address: Optional[str] = None
     gst_number: Optional[str] = Field(None, max_length=20)
@@ -42,11 +42,10 @@ class SupplierUpdate(BaseModel):
 
 class Supplier(SupplierBase):
     """Complete supplier model with all fields"""
-    id: UUID
+    id: UUIDStr
     status: SupplierStatus = SupplierStatus.ACTIVE
-    created_by: Optional[UUID] = None
+    created_by: Optional[UUIDStr] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -4,19 +4,19 @@ Variance Models for PoultryRetail-Core
 Pydantic models for variance logs and approval workflow.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
-from uuid import UUID
 
 from .enums import BirdType, InventoryType, VarianceType, VarianceLogStatus
+from .identifiers import UUIDStr
 
 
 class VarianceLog(BaseModel):
     """Variance log entry from settlement"""
-    id: UUID
-    settlement_id: UUID
+    id: UUIDStr
+    settlement_id: UUIDStr
     bird_type: BirdType
     inventory_type: InventoryType
     variance_type: VarianceType
@@ -24,14 +24,13 @@ class VarianceLog(BaseModel):
     declared_weight: Decimal
     variance_weight: Decimal  # Absolute value
     status: VarianceLogStatus
-    resolved_by: Optional[UUID] = None
+    resolved_by: Optional[UUIDStr] = None
     resolved_at: Optional[datetime] = None
     notes: Optional[str] = None
-    ledger_entry_id: Optional[UUID] = None
+    ledger_entry_id: Optional[UUIDStr] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class VarianceLogWithDetails(VarianceLog):
@@ -42,20 +41,21 @@ class VarianceLogWithDetails(VarianceLog):
     submitted_by_name: Optional[str] = None
     resolved_by_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class VarianceApproval(BaseModel):
     """Model for approving positive variance"""
     notes: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class VarianceDeduction(BaseModel):
     """Model for deducting negative variance"""
     confirm: bool = Field(..., description="Must be True to confirm deduction")
     notes: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class VarianceListResponse(BaseModel):
     """Response model for variance list"""
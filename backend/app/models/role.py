@@ -4,7 +4,7 @@ Role Models
 Pydantic models for role-related data validation and serialization.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 
@@ -25,6 +25,8 @@ class RoleUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=50)
     description: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Role(RoleBase):
     """Role model with all fields"""
@@ -32,8 +34,7 @@ class Role(RoleBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class RoleWithPermissions(Role):
@@ -4,14 +4,15 @@ User Models
 Pydantic models for user-related data validation and serialization.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 
 
 class UserBase(BaseModel):
     """Base user model with common fields"""
-    email: EmailStr
+    # Shape check only; Supabase Auth does the full address validation
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$', max_length=254)
     full_name: Optional[str] = None
 
 
@@ -25,6 +26,8 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     avatar_url: Optional[str] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class UserProfile(UserBase):
     """User profile model"""
@@ -33,8 +36,7 @@ class UserProfile(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserWithRoles(UserProfile):
@@ -1,4 +1,34 @@
 """Routers module"""
-from app.routers import auth, users, roles, permissions, admin, health, business_management, rate_limits, ai, activity_logs, user_dashboard, transaction_logs
 
-__all__ = ["auth", "users", "roles", "permissions", "admin", "health", "business_management", "rate_limits", "ai", "activity_logs", "user_dashboard", "transaction_logs"]
+import importlib
+
+# Router submodules are imported on first attribute access (PEP 562), so
+# importing the package does not build every router's models up front.
+_SUBMODULES = (
+    "auth",
+    "users",
+    "roles",
+    "permissions",
+    "admin",
+    "health",
+    "business_management",
+    "rate_limits",
+    "ai",
+    "activity_logs",
+    "user_dashboard",
+    "transaction_logs",
+)
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
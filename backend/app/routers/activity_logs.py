@@ -5,6 +5,7 @@ API endpoints for viewing and auditing system activity logs.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime, date
@@ -49,7 +50,9 @@ async def get_activity_logs(
         
         logs = response.data if response.data else []
         logger.info(f"Fetched {len(logs)} activity logs with profile data")
-        return logs
+        # Rows are already plain JSON from PostgREST: encode them directly
+        # instead of walking them through jsonable_encoder first
+        return ORJSONResponse(logs)
         
     except Exception as e:
         logger.error(f"Error fetching activity logs: {e}")
@@ -65,15 +68,14 @@ async def get_activity_logs(
 async def get_activity_stats():
     """Get aggregated activity statistics for the dashboard."""
     try:
-        # Get count by event type
-        # In a real app, this might be a more complex RPC or separate service call
-        response = supabase_client.table("app_activity_logs").select("event_type", count="exact").execute()
+        # Counts come from the trigger-maintained daily rollup, not a table scan
+        response = supabase_client.rpc("get_activity_stats_fast").execute()
+        stats = response.data or {}
         
-        # This is a simplified stats response
-        return {
-            "total_logs": response.count if hasattr(response, 'count') else len(response.data),
-            "summary": response.data
-        }
+        return ORJSONResponse({
+            "total_logs": stats.get("total_logs", 0),
+            "summary": stats.get("by_event", [])
+        })
     except Exception as e:
         logger.error(f"Error fetching activity stats: {e}")
         return {"error": str(e)}
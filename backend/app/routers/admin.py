@@ -5,15 +5,19 @@ Admin-specific endpoints for managing users, roles, and system settings.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
-from typing import List, Dict
+from fastapi.responses import ORJSONResponse
+from typing import Any, List, Dict, Optional, Tuple
+import asyncio
 import logging
+import orjson
 from datetime import datetime, timezone
 
 from app.services.user_service import UserService
 from app.services.role_service import RoleService
-from app.services.supabase_client import supabase_client
+from app.services.supabase_client import supabase_client, execute_async
 from app.dependencies.rbac import require_admin, require_permission
 from app.dependencies.auth import get_current_user
+from app.dependencies.body import json_body, json_body_openapi
 from app.models.user import UserProfile
 from app.models.role import Role
 
@@ -28,7 +32,6 @@ router = APIRouter()
 
 @router.get(
     "/users",
-    response_model=List[Dict],
     dependencies=[Depends(require_admin)]
 )
 async def admin_get_all_users(
@@ -41,12 +44,13 @@ async def admin_get_all_users(
     
     users = await user_service.get_all_users(limit=limit, offset=offset)
     
-    # Enrich with roles
+    # Enrich with roles (one query for the whole page)
+    role_map = await role_service.get_roles_for_users([user["id"] for user in users])
     for user in users:
-        roles = await role_service.get_user_roles(user["id"])
-        user["roles"] = [role["name"] for role in roles]
+        user["roles"] = role_map.get(user["id"], [])
     
-    return users
+    # Plain PostgREST rows: encode directly, no response_model walk
+    return ORJSONResponse(users)
 
 
 @router.post(
@@ -143,27 +147,47 @@ async def admin_remove_role(
 
 @router.get(
     "/roles",
-    response_model=List[Dict],
     dependencies=[Depends(require_admin)]
 )
 async def admin_get_all_roles():
     """Get all roles with permissions (Admin only)"""
     role_service = RoleService()
     
-    roles = await role_service.get_all_roles()
+    roles = await role_service.get_all_roles_with_permissions()
     
-    # Enrich with permissions
-    for role in roles:
-        permissions = await role_service.get_role_permissions(role["id"])
-        role["permissions"] = permissions
-    
-    return roles
+    return ORJSONResponse(roles)
 
 
 # =============================================================================
 # SYSTEM SETTINGS
 # =============================================================================
 
+# system_settings stores every value as text; value_type says how to read it
+_SETTING_PARSERS = {
+    "boolean": lambda value: value.lower() == "true",
+    "number": lambda value: float(value) if "." in value else int(value),
+    "json": orjson.loads,
+}
+
+
+def _parse_setting_value(value: str, value_type: str) -> Any:
+    """Convert a stored setting value to its typed form (strings pass through)"""
+    parser = _SETTING_PARSERS.get(value_type)
+    return parser(value) if parser is not None else value
+
+
+def _serialize_setting_value(value: Any) -> Tuple[str, str]:
+    """Convert a setting value to its stored text and value_type"""
+    # bool first: it is also an int
+    if isinstance(value, bool):
+        return ("true" if value else "false"), "boolean"
+    if isinstance(value, (int, float)):
+        return str(value), "number"
+    if isinstance(value, dict):
+        return orjson.dumps(value).decode(), "json"
+    return str(value), "string"
+
+
 @router.get(
     "/settings",
     dependencies=[Depends(require_admin)]
@@ -171,29 +195,19 @@ async def admin_get_all_roles():
 async def admin_get_settings():
     """Get system settings (Admin only)"""
     try:
-        result = supabase_client.table("system_settings")\
-            .select("*")\
-            .execute()
+        result = await execute_async(
+            supabase_client.table("system_settings").select("*")
+        )
         
         settings_list = result.data if result.data else []
         
         # Convert to a dictionary for easier use
-        settings_dict = {}
-        for setting in settings_list:
-            key = setting["key"]
-            value = setting["value"]
-            value_type = setting.get("value_type", "string")
-            
-            # Convert value based on type
-            if value_type == "boolean":
-                settings_dict[key] = value.lower() == "true"
-            elif value_type == "number":
-                settings_dict[key] = float(value) if "." in value else int(value)
-            elif value_type == "json":
-                import json
-                settings_dict[key] = json.loads(value)
-            else:
-                settings_dict[key] = value
+        settings_dict = {
+            setting["key"]: _parse_setting_value(
+                setting["value"], setting.get("value_type", "string")
+            )
+            for setting in settings_list
+        }
         
         return {
             "message": "System settings retrieved",
@@ -215,45 +229,39 @@ async def admin_get_settings():
 
 @router.put(
     "/settings",
-    dependencies=[Depends(require_admin)]
+    dependencies=[Depends(require_admin)],
+    openapi_extra=json_body_openapi(Dict[str, Any])
 )
 async def admin_update_settings(
-    settings: Dict,
-    current_user: Dict = Depends(get_current_user)
+    current_user: Dict = Depends(get_current_user),
+    settings: Dict[str, Any] = Depends(json_body(Dict[str, Any]))
 ):
     """Update system settings (Admin only)"""
     from app.services.audit_service import audit_logger
+    from app.routers.auth import invalidate_setting_cache
     
     try:
-        updated_keys = []
+        updated_keys = list(settings.keys())
+        rows = []
         
         for key, value in settings.items():
             # Convert value to string for storage
-            if isinstance(value, bool):
-                str_value = "true" if value else "false"
-                value_type = "boolean"
-            elif isinstance(value, (int, float)):
-                str_value = str(value)
-                value_type = "number"
-            elif isinstance(value, dict):
-                import json
-                str_value = json.dumps(value)
-                value_type = "json"
-            else:
-                str_value = str(value)
-                value_type = "string"
-            
-            # Upsert the setting
-            supabase_client.table("system_settings")\
-                .upsert({
-                    "key": key,
-                    "value": str_value,
-                    "value_type": value_type,
-                    "updated_by": current_user["id"]
-                })\
-                .execute()
+            str_value, value_type = _serialize_setting_value(value)
             
-            updated_keys.append(key)
+            rows.append({
+                "key": key,
+                "value": str_value,
+                "value_type": value_type,
+                "updated_by": current_user["id"]
+            })
+        
+        # Upsert all settings in one request
+        if rows:
+            await execute_async(
+                supabase_client.table("system_settings").upsert(rows, on_conflict="key")
+            )
+        
+        invalidate_setting_cache()
         
         # Audit log
         await audit_logger.log_action(
@@ -286,30 +294,21 @@ async def admin_update_settings(
 async def admin_get_setting(key: str):
     """Get a specific system setting (Admin only)"""
     try:
-        result = supabase_client.table("system_settings")\
-            .select("*")\
-            .eq("key", key)\
-            .single()\
-            .execute()
+        result = await execute_async(
+            supabase_client.table("system_settings")
+            .select("*")
+            .eq("key", key)
+            .maybe_single()
+        )
         
-        if not result.data:
+        if result is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Setting '{key}' not found"
             )
         
         setting = result.data
-        value = setting["value"]
-        value_type = setting.get("value_type", "string")
-        
-        # Convert value based on type
-        if value_type == "boolean":
-            value = value.lower() == "true"
-        elif value_type == "number":
-            value = float(value) if "." in value else int(value)
-        elif value_type == "json":
-            import json
-            value = json.loads(value)
+        value = _parse_setting_value(setting["value"], setting.get("value_type", "string"))
         
         return {
             "key": key,
@@ -337,16 +336,42 @@ async def admin_get_setting(key: str):
 )
 async def admin_get_logs(
     limit: int = Query(100, ge=1, le=1000),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    before: Optional[datetime] = Query(
+        None, description="Keyset cursor: timestamp of the last log seen (next_cursor.before)"
+    ),
+    before_id: Optional[int] = Query(
+        None, description="Keyset cursor: id of the last log seen (next_cursor.before_id)"
+    )
 ):
-    """Get audit logs (requires system.logs permission)"""
+    """
+    Get audit logs (requires system.logs permission)
+    
+    Pass the previous page's ``next_cursor`` values as ``before`` and
+    ``before_id`` to page by (timestamp, id); this walks
+    idx_audit_logs_timestamp_id instead of scanning and discarding ``offset``
+    rows, and logs sharing a timestamp across a page boundary are not
+    skipped. ``offset`` is ignored when ``before`` is set.
+    """
     try:
         # Fetch from audit_logs table
-        result = supabase_client.table("audit_logs")\
+        query = supabase_client.table("audit_logs")\
             .select("*")\
             .order("timestamp", desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
+            .order("id", desc=True)
+        if before is not None:
+            cursor_ts = before.isoformat()
+            if before_id is not None:
+                query = query.or_(
+                    f'timestamp.lt."{cursor_ts}",'
+                    f'and(timestamp.eq."{cursor_ts}",id.lt.{before_id})'
+                )
+            else:
+                query = query.lt("timestamp", cursor_ts)
+            query = query.limit(limit)
+        else:
+            query = query.range(offset, offset + limit - 1)
+        result = await execute_async(query)
         
         logs = result.data if result.data else []
         
@@ -357,36 +382,38 @@ async def admin_get_logs(
         user_map = {}
         if user_ids:
             try:
-                users_result = supabase_client.table("profiles")\
-                    .select("id, email, full_name")\
-                    .in_("id", user_ids)\
-                    .execute()
+                users_result = await execute_async(
+                    supabase_client.table("profiles")
+                    .select("id, email, full_name")
+                    .in_("id", user_ids)
+                )
                 
                 if users_result.data:
-                    for user in users_result.data:
-                        user_map[user['id']] = {
-                            'email': user.get('email'),
-                            'full_name': user.get('full_name')
-                        }
+                    user_map = {user['id']: user for user in users_result.data}
             except Exception as user_err:
                 logger.warning(f"Could not fetch user details: {str(user_err)}")
         
-        # Add user info to logs
+        # Add user info to logs (one map lookup per log)
         for log in logs:
-            user_id = log.get('user_id')
-            if user_id and user_id in user_map:
-                log['user_email'] = user_map[user_id].get('email')
-                log['user_name'] = user_map[user_id].get('full_name')
+            user = user_map.get(log.get('user_id'))
+            if user is not None:
+                log['user_email'] = user.get('email')
+                log['user_name'] = user.get('full_name')
             else:
                 log['user_email'] = None
                 log['user_name'] = None
         
-        return {
+        # Plain JSON rows: encode with orjson directly, skipping jsonable_encoder
+        return ORJSONResponse({
             "logs": logs,
             "total": len(logs),
             "limit": limit,
-            "offset": offset
-        }
+            "offset": offset,
+            "next_cursor": (
+                {"before": logs[-1].get("timestamp"), "before_id": logs[-1].get("id")}
+                if len(logs) == limit else None
+            )
+        })
     except Exception as e:
         logger.error(f"Error fetching audit logs: {str(e)}")
         # Return empty if table doesn't exist yet
@@ -394,7 +421,8 @@ async def admin_get_logs(
             "logs": [],
             "total": 0,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": None
         }
 
 
@@ -408,33 +436,49 @@ async def admin_get_logs(
 )
 async def admin_get_stats():
     """Get system statistics (requires system.admin permission)"""
-    user_service = UserService()
-    role_service = RoleService()
-    
-    users = await user_service.get_all_users(limit=10000)
-    roles = await role_service.get_all_roles()
-    permissions = await role_service.get_all_permissions()
+    async def count_rows(table: str) -> int:
+        # HEAD request with an exact count: no rows are transferred
+        try:
+            response = await execute_async(
+                supabase_client.table(table).select('id', count='exact', head=True)
+            )
+            return response.count or 0
+        except Exception as e:
+            logger.warning(f"Could not count {table}: {e}")
+            return 0
     
-    # Get active sessions count - count all users who have signed in
-    try:
-        # Simply count all users in profiles table as active sessions
-        # In a real app, you'd track actual sessions in a separate table
-        sessions_response = supabase_client.table('profiles').select(
-            'id', count='exact'
-        ).execute()
-        active_sessions_count = sessions_response.count or 0
-    except Exception as e:
-        logger.warning(f"Could not fetch sessions count: {e}")
-        active_sessions_count = 0
+    # Independent counts: run them concurrently
+    total_users, total_roles, total_permissions = await asyncio.gather(
+        count_rows('profiles'),
+        count_rows('roles'),
+        count_rows('permissions'),
+    )
     
     return {
-        "total_users": len(users),
-        "total_roles": len(roles),
-        "total_permissions": len(permissions),
-        "active_sessions": active_sessions_count
+        "total_users": total_users,
+        "total_roles": total_roles,
+        "total_permissions": total_permissions,
+        # Active sessions are approximated as all users with a profile
+        # (the same profiles count); user_sessions is not consulted here
+        "active_sessions": total_users
     }
 
 
+# Shape of a session entry for users without tracked device details
+_SESSION_TEMPLATE = {
+    "user_id": None,
+    "email": None,
+    "full_name": None,
+    "last_sign_in_at": None,
+    "created_at": None,
+    "ip_address": None,
+    "user_agent": None,
+    "device_type": None,
+    "browser": None,
+    "location": None,
+}
+
+
 @router.get(
     "/sessions",
     dependencies=[Depends(require_admin)]
@@ -444,22 +488,27 @@ async def get_active_sessions(request: Request):
     try:
         # Try to get sessions from user_sessions table if it exists
         try:
-            sessions_response = supabase_client.table('user_sessions').select(
+            sessions_response = await execute_async(supabase_client.table('user_sessions').select(
                 'user_id, ip_address, user_agent, device_type, browser, location, last_activity_at, created_at'
-            ).order('last_activity_at', desc=True).limit(100).execute()
+            ).order('last_activity_at', desc=True).limit(100))
+            
+            # Enrich with user profile data (one query for all session users)
+            user_ids = list({session['user_id'] for session in sessions_response.data})
+            profiles = {}
+            if user_ids:
+                profiles_response = await execute_async(supabase_client.table('profiles').select(
+                    'id, full_name, email'
+                ).in_('id', user_ids))
+                profiles = {profile['id']: profile for profile in profiles_response.data}
             
-            # Enrich with user profile data
             sessions = []
             for session in sessions_response.data:
-                # Get user profile
-                profile = supabase_client.table('profiles').select(
-                    'full_name, email'
-                ).eq('id', session['user_id']).single().execute()
+                profile = profiles.get(session['user_id'])
                 
                 sessions.append({
                     "user_id": session["user_id"],
-                    "email": profile.data.get('email') if profile.data else 'Unknown',
-                    "full_name": profile.data.get('full_name') if profile.data else None,
+                    "email": profile.get('email') if profile else 'Unknown',
+                    "full_name": profile.get('full_name') if profile else None,
                     "last_sign_in_at": session.get("last_activity_at"),
                     "created_at": session.get("created_at"),
                     "ip_address": session.get("ip_address"),
@@ -470,37 +519,34 @@ async def get_active_sessions(request: Request):
                 })
             
             if sessions:
-                return {
+                return ORJSONResponse({
                     "sessions": sessions,
                     "total": len(sessions)
-                }
+                })
         except Exception as e:
             logger.debug(f"user_sessions table not available: {e}")
         
         # Fallback: Get all users with their profile info
-        users_response = supabase_client.table('profiles').select(
+        users_response = await execute_async(supabase_client.table('profiles').select(
             'id, full_name, email, created_at'
-        ).order('created_at', desc=True).limit(50).execute()
+        ).order('created_at', desc=True).limit(50))
         
-        sessions = []
-        for user in users_response.data:
-            sessions.append({
+        sessions = [
+            {
+                **_SESSION_TEMPLATE,
                 "user_id": user["id"],
                 "email": user["email"],
                 "full_name": user.get("full_name"),
                 "last_sign_in_at": user.get("created_at"),
                 "created_at": user.get("created_at"),
-                "ip_address": None,
-                "user_agent": None,
-                "device_type": None,
-                "browser": None,
-                "location": None
-            })
+            }
+            for user in users_response.data
+        ]
         
-        return {
+        return ORJSONResponse({
             "sessions": sessions,
             "total": len(sessions)
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error fetching sessions: {e}")
@@ -6,8 +6,9 @@ API endpoints for AI assistant with conversation management.
 
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
+import time
 
 from app.dependencies.auth import get_current_user
 from app.dependencies.rbac import require_permission
@@ -191,24 +192,47 @@ async def delete_conversation(
 # ADMIN ENDPOINTS
 # =============================================================================
 
+# All AI configs joined with their role names: "configs" -> (configs, fetched_at).
+# Config writes below invalidate it; the TTL covers changes made elsewhere.
+AI_CONFIGS_CACHE_TTL = 60
+_ai_configs_cache: Dict[str, Tuple[List[Dict], float]] = {}
+
+
+def invalidate_ai_configs_cache() -> None:
+    """Drop the cached AI config list"""
+    _ai_configs_cache.clear()
+
+
+async def _get_ai_configs_with_roles() -> List[Dict]:
+    """All AI configs with role_name, from one embedded query (cached)"""
+    from app.services.supabase_client import supabase_client, execute_async
+    
+    cached = _ai_configs_cache.get("configs")
+    if cached is not None and time.monotonic() - cached[1] < AI_CONFIGS_CACHE_TTL:
+        return cached[0]
+    
+    response = await execute_async(
+        supabase_client.table('ai_agent_configs').select('*, roles(name)').order('role_id')
+    )
+    configs = response.data if response.data else []
+    for config in configs:
+        role = config.pop('roles', None)
+        config['role_name'] = role['name'] if role else 'Unknown'
+    
+    _ai_configs_cache["configs"] = (configs, time.monotonic())
+    return configs
+
+
 @router.get(
     "/configs",
     dependencies=[Depends(require_permission(["ai.admin"]))]
 )
 async def get_ai_configs(current_user: dict = Depends(get_current_user)):
     """Get AI configurations for all roles"""
-    from app.services.supabase_client import supabase_client
-    
     role_service = RoleService()
     
-    # Get configs
-    response = supabase_client.table('ai_agent_configs').select('*').order('role_id').execute()
-    configs = response.data if response.data else []
-    
-    # Enrich with role names
-    for config in configs:
-        role = await role_service.get_role_by_id(config['role_id'])
-        config['role_name'] = role['name'] if role else 'Unknown'
+    # Configs with role names (shared, not mutated below: filtering copies)
+    configs = await _get_ai_configs_with_roles()
     
     # Apply field filtering
     user_permissions = await role_service.get_user_permissions(current_user["id"])
@@ -226,12 +250,12 @@ async def update_ai_config(
     current_user: dict = Depends(get_current_user)
 ):
     """Update AI configuration for a role"""
-    from app.services.supabase_client import supabase_client
+    from app.services.supabase_client import supabase_client, execute_async
     from app.services.audit_service import audit_logger
     
     # Get existing state for audit diff
-    existing = supabase_client.table('ai_agent_configs').select('*').eq('id', config_id).single().execute()
-    if not existing.data:
+    existing = await execute_async(supabase_client.table('ai_agent_configs').select('*').eq('id', config_id).maybe_single())
+    if existing is None:
         raise HTTPException(status_code=404, detail="Config not found")
     
     # Build update data
@@ -246,7 +270,8 @@ async def update_ai_config(
     # Calculate diff
     before = {k: existing.data.get(k) for k in update_data.keys()}
     
-    response = supabase_client.table('ai_agent_configs').update(update_data).eq('id', config_id).execute()
+    response = await execute_async(supabase_client.table('ai_agent_configs').update(update_data).eq('id', config_id))
+    invalidate_ai_configs_cache()
     
     if response.data:
         # Audit log with diff
@@ -279,38 +304,31 @@ async def toggle_ai_config(
     current_user: dict = Depends(get_current_user)
 ):
     """Toggle AI enabled/disabled for a role"""
-    from app.services.supabase_client import supabase_client
+    from app.services.supabase_client import supabase_client, execute_async
     from app.services.audit_service import audit_logger
     
-    # Get current state
-    existing = supabase_client.table('ai_agent_configs').select('enabled').eq('id', config_id).single().execute()
+    # Flip the flag in one statement; NULL means the config does not exist
+    response = await execute_async(supabase_client.rpc('toggle_ai_enabled', {'p_config_id': config_id}))
+    new_state = response.data
     
-    if not existing.data:
+    if new_state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Config not found"
         )
     
-    new_state = not existing.data['enabled']
+    invalidate_ai_configs_cache()
     
-    response = supabase_client.table('ai_agent_configs').update({'enabled': new_state}).eq('id', config_id).execute()
-    
-    if response.data:
-        await audit_logger.log_action(
-            user_id=current_user["id"],
-            action="TOGGLE_AI_CONFIG",
-            resource_type="ai_agent_config",
-            resource_id=str(config_id),
-            changes={"enabled": new_state},
-            metadata={}
-        )
-        
-        return {
-            "message": f"AI {'enabled' if new_state else 'disabled'}",
-            "enabled": new_state
-        }
-    
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail="Failed to toggle"
+    await audit_logger.log_action(
+        user_id=current_user["id"],
+        action="TOGGLE_AI_CONFIG",
+        resource_type="ai_agent_config",
+        resource_id=str(config_id),
+        changes={"enabled": new_state},
+        metadata={}
     )
+    
+    return {
+        "message": f"AI {'enabled' if new_state else 'disabled'}",
+        "enabled": new_state
+    }
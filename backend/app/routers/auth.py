@@ -5,12 +5,14 @@ Endpoints for user authentication and registration.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends, Request
-from typing import Dict
+from typing import Dict, Optional, Tuple
+import asyncio
 import logging
+import time
 
 from datetime import datetime
 from app.config.settings import settings
-from app.services.supabase_client import supabase_client
+from app.services.supabase_client import supabase_client, execute_async
 from app.models.user import UserCreate
 from app.dependencies.auth import get_current_user
 from app.services.audit_service import audit_logger
@@ -21,38 +23,67 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Boolean system settings read on public auth endpoints: key -> (value, fetched_at).
+# Admin updates invalidate immediately; other workers see changes within the TTL.
+SETTINGS_CACHE_TTL = 30
+_settings_cache: Dict[str, Tuple[bool, float]] = {}
+_settings_lock = asyncio.Lock()
+
+
+def _cached_setting(key: str) -> Optional[bool]:
+    entry = _settings_cache.get(key)
+    if entry is not None and time.monotonic() - entry[1] < SETTINGS_CACHE_TTL:
+        return entry[0]
+    return None
+
+
+def invalidate_setting_cache(key: Optional[str] = None) -> None:
+    """Drop one cached system setting, or all of them"""
+    if key is None:
+        _settings_cache.clear()
+    else:
+        _settings_cache.pop(key, None)
+
+
+async def _get_bool_setting(key: str, default: bool) -> bool:
+    """Read a boolean system setting, serving it from the TTL cache when fresh"""
+    value = _cached_setting(key)
+    if value is not None:
+        return value
+    
+    # Single flight: concurrent misses wait for one fetch
+    async with _settings_lock:
+        value = _cached_setting(key)
+        if value is not None:
+            return value
+        
+        try:
+            query = supabase_client.table("system_settings")\
+                .select("value")\
+                .eq("key", key)\
+                .maybe_single()
+            result = await asyncio.to_thread(query.execute)
+        except Exception as e:
+            # Not cached, so the next request retries
+            logger.warning(f"Could not check {key} setting: {e}")
+            return default
+        
+        data = result.data if result else None
+        value = data["value"].lower() == "true" if data else default
+        _settings_cache[key] = (value, time.monotonic())
+        return value
+
+
 async def is_registration_enabled() -> bool:
     """Check if user registration is enabled in system settings"""
-    try:
-        result = supabase_client.table("system_settings")\
-            .select("value")\
-            .eq("key", "registration_enabled")\
-            .single()\
-            .execute()
-        
-        if result.data:
-            return result.data["value"].lower() == "true"
-        return True  # Default to enabled if setting not found
-    except Exception as e:
-        logger.warning(f"Could not check registration setting: {e}")
-        return True  # Default to enabled on error
+    # Default to enabled if setting not found
+    return await _get_bool_setting("registration_enabled", True)
 
 
 async def is_maintenance_mode() -> bool:
     """Check if maintenance mode is enabled in system settings"""
-    try:
-        result = supabase_client.table("system_settings")\
-            .select("value")\
-            .eq("key", "maintenance_mode")\
-            .single()\
-            .execute()
-        
-        if result.data:
-            return result.data["value"].lower() == "true"
-        return False  # Default to disabled if setting not found
-    except Exception as e:
-        logger.warning(f"Could not check maintenance mode setting: {e}")
-        return False  # Default to disabled on error
+    # Default to disabled if setting not found
+    return await _get_bool_setting("maintenance_mode", False)
 
 
 @router.get("/registration-status")
@@ -92,7 +123,7 @@ async def signup(user_data: UserCreate, request: Request) -> Dict:
     
     try:
         # Sign up with Supabase Auth
-        response = supabase_client.auth.sign_up({
+        response = await asyncio.to_thread(supabase_client.auth.sign_up, {
             "email": user_data.email,
             "password": user_data.password,
             "options": {
@@ -105,11 +136,11 @@ async def signup(user_data: UserCreate, request: Request) -> Dict:
         if response.user:
             # Manually create profile if trigger fails
             try:
-                supabase_client.table('profiles').insert({
+                await execute_async(supabase_client.table('profiles').insert({
                     'id': response.user.id,
                     'email': response.user.email,
                     'full_name': user_data.full_name or ''
-                }).execute()
+                }))
             except Exception as profile_error:
                 # Profile might already exist from trigger, that's okay
                 logger.warning(f"Profile creation info: {str(profile_error)}")
@@ -172,7 +203,7 @@ async def login(email: str, password: str, request: Request) -> Dict:
     """
     try:
         logger.info(f"Attempting login for user: {email}")
-        response = supabase_client.auth.sign_in_with_password({
+        response = await asyncio.to_thread(supabase_client.auth.sign_in_with_password, {
             "email": email,
             "password": password
         })
@@ -279,17 +310,17 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user))
     user_service = UserService()
     role_service = RoleService()
     
-    # Get user profile
-    profile = await user_service.get_user_by_id(current_user["id"])
-    
-    # Get user roles and permissions
-    roles = await role_service.get_user_roles(current_user["id"])
-    permissions = await role_service.get_user_permissions(current_user["id"])
+    # Profile and the (cached) roles/permissions bundle are independent:
+    # fetch them concurrently
+    profile, bundle = await asyncio.gather(
+        user_service.get_user_by_id(current_user["id"]),
+        role_service.get_user_auth_bundle(current_user["id"]),
+    )
     
     return {
         "user": profile,
-        "roles": [role["name"] for role in roles],
-        "permissions": permissions
+        "roles": [role["name"] for role in bundle["roles"]],
+        "permissions": list(bundle["permissions"])
     }
 
 
@@ -297,7 +328,7 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user))
 async def refresh_token(refresh_token: str, request: Request) -> Dict:
     """Refresh access token"""
     try:
-        response = supabase_client.auth.refresh_session(refresh_token)
+        response = await asyncio.to_thread(supabase_client.auth.refresh_session, refresh_token)
         
         if response.session:
             # Log Activity
@@ -16,7 +16,7 @@ import logging
 from app.services.supabase_client import supabase_client
 from app.dependencies.rbac import require_permission, require_admin
 from app.dependencies.auth import get_current_user
-from app.services.role_service import RoleService
+from app.services.role_service import RoleService, invalidate_user_authz
 from app.models.business_management import (
     Shop, ShopCreate, ShopUpdate,
     ManagerWithProfile, ManagerOnboardRequest, UnassignedManager,
@@ -509,6 +509,7 @@ async def onboard_manager(
             user_shop_response = supabase_client.table("user_shops")\
                 .insert(user_shop_data)\
                 .execute()
+            invalidate_user_authz(request.user_id)
             
             if not user_shop_response.data:
                 # Rollback manager_details
@@ -606,6 +607,7 @@ async def remove_manager(
             .delete()\
             .eq("user_id", user_id)\
             .execute()
+        invalidate_user_authz(user_id)
         
         # Delete manager_details
         supabase_client.table("manager_details")\
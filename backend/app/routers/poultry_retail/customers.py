@@ -14,6 +14,7 @@ from app.models.poultry_retail.customers import (
     CustomerCreate, CustomerUpdate, Customer, CustomerWithBalance, CustomerStatus
 )
 from app.models.poultry_retail.ledger import FinancialLedgerEntry
+from app.utils.responses import model_list_response
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
@@ -179,4 +180,4 @@ async def get_customer_ledger(
         .order("created_at", desc=True) \
         .execute()
     
-    return result.data
+    return model_list_response(FinancialLedgerEntry, result.data)
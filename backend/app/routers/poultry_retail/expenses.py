@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Header, Request
 from typing import Optional, List
 from datetime import date, datetime, timedelta
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from decimal import Decimal
 
 from app.dependencies.rbac import require_permission
@@ -192,8 +192,7 @@ class ExpenseItem(BaseModel):
     approved_by: Optional[UUID] = None
     approved_at: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExpenseListResponse(BaseModel):
@@ -9,7 +9,7 @@ from typing import Optional, List
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from enum import Enum
 
 from app.dependencies.rbac import require_permission
@@ -47,8 +47,7 @@ class MonthlyPerformance(BaseModel):
     net_incentive: Decimal
     is_locked: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PerformanceWithUser(MonthlyPerformance):
@@ -96,6 +95,17 @@ def validate_store_access(store_id: int, user: dict) -> bool:
     return store_id in user.get("store_ids", [])
 
 
+def _profiles_by_id(supabase, user_ids) -> dict:
+    """Fetch email/full_name for many users in one query, keyed by user id"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+    result = supabase.table("profiles").select(
+        "id, email, full_name"
+    ).in_("id", user_ids).execute()
+    return {profile["id"]: profile for profile in result.data}
+
+
 # =============================================================================
 # CONFIGURATION ENDPOINTS
 # =============================================================================
@@ -296,15 +306,11 @@ async def get_monthly_performance(
     
     result = query.order("normalized_score", desc=True).execute()
     
-    # Get user info for each performance record
+    # Get user info for all performance records in one query
+    profiles = _profiles_by_id(supabase, [row["user_id"] for row in result.data])
     performances = []
     for row in result.data:
-        # Fetch profile info separately
-        profile_result = supabase.table("profiles").select(
-            "email, full_name"
-        ).eq("id", row["user_id"]).execute()
-        
-        profile = profile_result.data[0] if profile_result.data else {}
+        profile = profiles.get(row["user_id"], {})
         
         performances.append(PerformanceWithUser(
             **row,
@@ -463,14 +469,10 @@ async def get_fraud_flags(
     
     result = query.execute()
     
+    profiles = _profiles_by_id(supabase, [row["user_id"] for row in result.data])
     at_risk = []
     for row in result.data:
-        # Fetch profile info separately
-        profile_result = supabase.table("profiles").select(
-            "email, full_name"
-        ).eq("id", row["user_id"]).execute()
-        
-        profile = profile_result.data[0] if profile_result.data else {}
+        profile = profiles.get(row["user_id"], {})
         
         at_risk.append({
             **row,
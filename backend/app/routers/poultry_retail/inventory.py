@@ -7,14 +7,16 @@ API endpoints for inventory and stock management.
 from fastapi import APIRouter, Depends, HTTPException, Query, Header
 from typing import Optional
 from datetime import date, datetime
+from decimal import Decimal
 from uuid import UUID
 
 from app.dependencies.rbac import require_permission
 from app.models.poultry_retail.inventory import (
-    InventoryLedgerEntry, InventoryLedgerCreate,
+    InventoryLedgerEntry, InventoryLedgerCreate, InventoryLedgerBulkCreate,
     CurrentStock, StockSummary, StockByType
 )
 from app.models.poultry_retail.enums import BirdType, InventoryType
+from app.utils.responses import model_response, model_list_response
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -46,26 +48,23 @@ async def get_current_stock(
     # Use the get_current_stock function
     result = supabase.rpc("get_current_stock", {"p_store_id": x_store_id}).execute()
     
-    # Build stock summary
+    # Collect quantities per bird type, then validate each breakdown once
+    stock = {"BROILER": {}, "PARENT_CULL": {}}
+    for row in result.data:
+        inv_type = row["inventory_type"]
+        target = stock["BROILER"] if row["bird_type"] == "BROILER" else stock["PARENT_CULL"]
+        target[inv_type] = row["current_qty"]
+        if inv_type == "LIVE":
+            target["LIVE_COUNT"] = row.get("current_bird_count", 0)
+    
     summary = StockSummary(
         store_id=x_store_id,
-        BROILER=StockByType(),
-        PARENT_CULL=StockByType(),
+        BROILER=StockByType(**stock["BROILER"]),
+        PARENT_CULL=StockByType(**stock["PARENT_CULL"]),
         as_of=datetime.utcnow()
     )
     
-    for row in result.data:
-        bird_type = row["bird_type"]
-        inv_type = row["inventory_type"]
-        qty = row["current_qty"]
-        count = row.get("current_bird_count", 0)
-        
-        target = summary.BROILER if bird_type == "BROILER" else summary.PARENT_CULL
-        setattr(target, inv_type, qty)
-        if inv_type == "LIVE":
-            setattr(target, "LIVE_COUNT", count)
-    
-    return summary
+    return model_response(summary)
 
 
 @router.get("/stock/{bird_type}", response_model=StockByType)
@@ -87,14 +86,14 @@ async def get_stock_by_bird_type(
         "p_bird_type": bird_type.value
     }).execute()
     
-    stock = StockByType()
+    stock = {}
     for row in result.data:
         inv_type = row["inventory_type"]
-        setattr(stock, inv_type, row["current_qty"])
+        stock[inv_type] = row["current_qty"]
         if inv_type == "LIVE":
-            stock.LIVE_COUNT = row.get("current_bird_count", 0)
+            stock["LIVE_COUNT"] = row.get("current_bird_count", 0)
     
-    return stock
+    return model_response(StockByType(**stock))
 
 
 @router.get("/ledger", response_model=list[InventoryLedgerEntry])
@@ -142,7 +141,7 @@ async def get_ledger_entries(
     
     result = query.execute()
     
-    return result.data
+    return model_list_response(InventoryLedgerEntry, result.data)
 
 
 @router.post("/adjust", response_model=InventoryLedgerEntry, status_code=201)
@@ -242,6 +241,91 @@ async def create_adjustment(
     return entry.data[0]
 
 
+@router.post("/ledger/bulk", response_model=list[InventoryLedgerEntry], status_code=201)
+async def create_ledger_entries_bulk(
+    payload: InventoryLedgerBulkCreate,
+    x_store_id: int = Header(..., description="Store ID for context"),
+    current_user: dict = Depends(require_permission(["inventory.adjust"]))
+):
+    """
+    Append a batch of inventory ledger entries in one insert (Admin only).
+    
+    Intended for bulk bird receipts and processing runs. Each entry must carry
+    an explicit quantity_change whose sign matches its reason code's
+    direction; absolute overwrites go through /adjust. Debits are summed per
+    bird and inventory type and checked against available stock, as /adjust
+    does. The batch is a single INSERT, so it is applied all-or-nothing.
+    """
+    from app.config.database import get_supabase
+    
+    if "Admin" not in current_user.get("roles", []):
+        raise HTTPException(status_code=403, detail="Only Admin can make adjustments")
+    
+    supabase = get_supabase()
+    
+    codes = {entry.reason_code for entry in payload.entries}
+    code_result = supabase.table("inventory_reason_codes").select("code, direction").in_(
+        "code", list(codes)
+    ).execute()
+    directions = {row["code"]: row["direction"] for row in code_result.data}
+    
+    rows = []
+    debits = {}
+    for index, entry in enumerate(payload.entries):
+        if entry.store_id != x_store_id:
+            raise HTTPException(status_code=400, detail=f"Entry {index}: Store ID mismatch with header")
+        if entry.quantity_change is None:
+            raise HTTPException(status_code=400, detail=f"Entry {index}: quantity_change is required")
+        
+        direction = directions.get(entry.reason_code)
+        if direction is None:
+            raise HTTPException(status_code=400, detail=f"Entry {index}: Unknown reason code {entry.reason_code}")
+        if (direction == "CREDIT" and entry.quantity_change <= 0) or (
+            direction == "DEBIT" and entry.quantity_change >= 0
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Entry {index}: {entry.reason_code} is a {direction} reason code; quantity_change has the wrong sign"
+            )
+        
+        if entry.quantity_change < 0:
+            key = (entry.bird_type.value, entry.inventory_type.value)
+            debits[key] = debits.get(key, Decimal("0")) - entry.quantity_change
+        
+        rows.append({
+            "store_id": entry.store_id,
+            "bird_type": entry.bird_type.value,
+            "inventory_type": entry.inventory_type.value,
+            "quantity_change": str(entry.quantity_change),
+            "bird_count_change": entry.bird_count_change or 0,
+            "reason_code": entry.reason_code,
+            "ref_type": "BULK",
+            "user_id": current_user["user_id"],
+            "notes": entry.notes,
+        })
+    
+    for (bird_type, inventory_type), required_qty in debits.items():
+        stock_check = supabase.rpc("validate_stock_available", {
+            "p_store_id": x_store_id,
+            "p_bird_type": bird_type,
+            "p_inventory_type": inventory_type,
+            "p_required_qty": float(required_qty)
+        }).execute()
+        
+        if not stock_check.data:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Insufficient {bird_type} {inventory_type} stock for this batch"
+            )
+    
+    result = supabase.table("inventory_ledger").insert(rows).execute()
+    
+    if not result.data:
+        raise HTTPException(status_code=400, detail="Failed to create ledger entries")
+    
+    return model_list_response(InventoryLedgerEntry, result.data, status_code=201)
+
+
 @router.get("/reason-codes")
 async def get_reason_codes(
     current_user: dict = Depends(require_permission(["inventory.view"]))
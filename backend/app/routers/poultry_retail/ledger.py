@@ -13,6 +13,8 @@ from pydantic import BaseModel
 from datetime import datetime
 
 from app.dependencies.rbac import require_permission
+from app.models.poultry_retail.enums import LedgerEntityType, LedgerTransactionType
+from app.utils.responses import model_list_response
 
 router = APIRouter(prefix="/ledger", tags=["Ledger"])
 
@@ -34,9 +36,9 @@ class LedgerEntry(BaseModel):
     """Individual ledger transaction"""
     id: UUID
     store_id: Optional[int] = None
-    entity_type: str
+    entity_type: LedgerEntityType
     entity_id: UUID
-    transaction_type: str
+    transaction_type: LedgerTransactionType
     debit: Decimal = Decimal("0")
     credit: Decimal = Decimal("0")
     notes: Optional[str] = None
@@ -164,7 +166,7 @@ async def get_supplier_ledger_detail(
         entry["credit"] = safe_decimal(entry.get("credit"))
         sanitized.append(entry)
     
-    return sanitized
+    return model_list_response(LedgerEntry, sanitized)
 
 
 @router.get("/customers", response_model=list[CustomerLedgerSummary])
@@ -257,7 +259,7 @@ async def get_customer_ledger_detail(
         entry["credit"] = safe_decimal(entry.get("credit"))
         sanitized.append(entry)
     
-    return sanitized
+    return model_list_response(LedgerEntry, sanitized)
 
 
 
@@ -267,8 +269,8 @@ async def get_all_ledger_entries(
     offset: int = 0,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
-    entity_type: Optional[str] = None,
-    transaction_type: Optional[str] = None,
+    entity_type: Optional[LedgerEntityType] = None,
+    transaction_type: Optional[LedgerTransactionType] = None,
     store_id: Optional[int] = None,
     search: Optional[str] = None,
     current_user: dict = Depends(require_permission(["ledger.view"]))
@@ -288,9 +290,9 @@ async def get_all_ledger_entries(
     if to_date:
         query = query.lte("created_at", to_date)
     if entity_type:
-        query = query.eq("entity_type", entity_type)
+        query = query.eq("entity_type", entity_type.value)
     if transaction_type:
-        query = query.eq("transaction_type", transaction_type)
+        query = query.eq("transaction_type", transaction_type.value)
     if store_id:
         query = query.eq("store_id", store_id)
     if search:
@@ -341,4 +343,4 @@ async def get_all_ledger_entries(
             "entity_phone": entity_info["phone"]
         })
         
-    return enriched_results
+    return model_list_response(EnrichedLedgerEntry, enriched_results)
@@ -19,6 +19,7 @@ from app.models.poultry_retail.inventory import (
 )
 from app.models.poultry_retail.enums import BirdType, InventoryType
 from app.routers.poultry_retail.utils import validate_store_access
+from app.utils.responses import model_list_response
 
 router = APIRouter(prefix="/processing", tags=["Processing"])
 
@@ -246,15 +247,18 @@ async def create_processing_entry(
     if not result.data:
         raise HTTPException(status_code=400, detail="Failed to create processing entry")
     
-    # Log the transaction
+    # Log the transaction with the weights the yield trigger stored on the row
+    created = result.data[0]
+    actual_output = created.get("actual_output_weight")
+    output_weight = Decimal(str(actual_output)) if actual_output is not None else entry.input_weight
     from app.services.transaction_logger_service import transaction_logger
     await transaction_logger.log_processing(
         user_id=str(current_user["user_id"]),
         store_id=entry.store_id,
-        processing_id=str(result.data[0].get("id", "")),
+        processing_id=str(created.get("id", "")),
         input_weight=entry.input_weight,
-        output_weight=entry.actual_output_weight or Decimal("0"),
-        wastage_weight=entry.input_weight - (entry.actual_output_weight or entry.input_weight),
+        output_weight=output_weight,
+        wastage_weight=entry.input_weight - output_weight,
         bird_type=entry.input_bird_type.value,
         output_type=entry.output_inventory_type.value,
         request=request
@@ -300,7 +304,7 @@ async def list_processing_entries(
     
     result = query.execute()
     
-    return result.data
+    return model_list_response(ProcessingEntry, result.data)
 
 
 @router.get("/wastage-config", response_model=list[WastageConfig])
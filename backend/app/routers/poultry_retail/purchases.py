@@ -11,7 +11,9 @@ from app.models.poultry_retail.purchases import (
     PurchaseAnalyticsResponse, PurchaseTrendItem, SupplierSpendItem, BirdTypeSpendItem
 )
 from app.models.poultry_retail.enums import PurchaseStatus, BirdType
+from app.models.poultry_retail.decimals import to_grams, from_grams
 from app.routers.poultry_retail.utils import validate_store_access
+from app.utils.responses import model_list_response
 
 router = APIRouter(prefix="/purchases", tags=["Purchases"])
 
@@ -52,7 +54,7 @@ async def get_purchase_analytics(
     
     # 1. KPIs
     total_spend = sum(Decimal(str(p["total_amount"])) for p in all_purchases)
-    total_weight = sum(Decimal(str(p["total_weight"])) for p in all_purchases)
+    total_weight = from_grams(sum(to_grams(p["total_weight"]) for p in all_purchases))
     total_birds = sum(int(p["bird_count"]) for p in all_purchases)
     avg_price = (total_spend / total_weight) if total_weight > 0 else Decimal("0")
     
@@ -65,11 +67,11 @@ async def get_purchase_analytics(
     }
     
     # 2. Trends (Grouped by Date)
-    trends_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": Decimal("0"), "birds": 0})
+    trends_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": 0, "birds": 0})
     for p in all_purchases:
         dt = p["created_at"][:10]  # Extract date YYYY-MM-DD
         trends_map[dt]["spend"] += Decimal(str(p["total_amount"]))
-        trends_map[dt]["weight"] += Decimal(str(p["total_weight"]))
+        trends_map[dt]["weight"] += to_grams(p["total_weight"])
         trends_map[dt]["birds"] += int(p["bird_count"])
         
     trends = []
@@ -77,17 +79,17 @@ async def get_purchase_analytics(
         trends.append(PurchaseTrendItem(
             date=d,
             spend=v["spend"],
-            weight=v["weight"],
+            weight=from_grams(v["weight"]),
             bird_count=v["birds"]
         ))
     
     # 3. Supplier Breakdown
-    supplier_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": Decimal("0"), "count": 0, "name": "Unknown"})
+    supplier_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": 0, "count": 0, "name": "Unknown"})
     for p in all_purchases:
         sid = p["supplier_id"]
         sname = p.get("suppliers", {}).get("name", "Unknown") if p.get("suppliers") else "Unknown"
         supplier_map[sid]["spend"] += Decimal(str(p["total_amount"]))
-        supplier_map[sid]["weight"] += Decimal(str(p["total_weight"]))
+        supplier_map[sid]["weight"] += to_grams(p["total_weight"])
         supplier_map[sid]["count"] += 1
         supplier_map[sid]["name"] = sname
         
@@ -96,23 +98,23 @@ async def get_purchase_analytics(
         suppliers_list.append(SupplierSpendItem(
             supplier_name=v["name"],
             amount=v["spend"],
-            weight=v["weight"],
+            weight=from_grams(v["weight"]),
             count=v["count"]
         ))
     
     # 4. Bird Type Distribution
-    bird_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": Decimal("0")})
+    bird_map = defaultdict(lambda: {"spend": Decimal("0"), "weight": 0})
     for p in all_purchases:
         bt = p["bird_type"]
         bird_map[bt]["spend"] += Decimal(str(p["total_amount"]))
-        bird_map[bt]["weight"] += Decimal(str(p["total_weight"]))
+        bird_map[bt]["weight"] += to_grams(p["total_weight"])
         
     bird_types_list = []
     for bt, v in bird_map.items():
         bird_types_list.append(BirdTypeSpendItem(
             bird_type=bt,
             amount=v["spend"],
-            weight=v["weight"]
+            weight=from_grams(v["weight"])
         ))
         
     return PurchaseAnalyticsResponse(
@@ -177,7 +179,7 @@ async def list_purchases(
         row["supplier_contact"] = supplier_data.get("phone")
         purchases.append(row)
     
-    return purchases
+    return model_list_response(PurchaseWithSupplier, purchases)
 
 
 
@@ -12,12 +12,15 @@ from decimal import Decimal
 from collections import defaultdict
 
 from app.dependencies.rbac import require_permission
+from app.dependencies.body import json_body, json_body_openapi
 from app.models.poultry_retail.sales import (
     SaleCreate, Sale, SaleWithItems, SaleItemWithSKU, SaleSummary,
     SalesAnalyticsResponse, SaleTrendItem, PaymentBreakdownItem, SKURankingItem
 )
 from app.models.poultry_retail.enums import PaymentMethod, SaleType
+from app.models.poultry_retail.decimals import to_grams, from_grams
 from app.routers.poultry_retail.utils import validate_store_access
+from app.utils.responses import model_response, model_list_response
 
 router = APIRouter(prefix="/sales", tags=["Sales"])
 
@@ -111,12 +114,12 @@ async def get_sales_analytics(
         items_result = items_query.execute()
         all_items = items_result.data
         
-        sku_map = defaultdict(lambda: {"revenue": Decimal("0"), "weight": Decimal("0"), "count": 0, "name": "", "code": ""})
+        sku_map = defaultdict(lambda: {"revenue": Decimal("0"), "weight": 0, "count": 0, "name": "", "code": ""})
         for item in all_items:
             sku_id = item["sku_id"]
             sku_info = item["skus"]
             sku_map[sku_id]["revenue"] += Decimal(str(item["total"]))
-            sku_map[sku_id]["weight"] += Decimal(str(item["weight"]))
+            sku_map[sku_id]["weight"] += to_grams(item["weight"])
             sku_map[sku_id]["count"] += 1
             sku_map[sku_id]["name"] = sku_info["name"]
             sku_map[sku_id]["code"] = sku_info["code"]
@@ -127,7 +130,7 @@ async def get_sales_analytics(
                 name=v["name"],
                 code=v["code"],
                 revenue=v["revenue"],
-                weight=v["weight"],
+                weight=from_grams(v["weight"]),
                 count=v["count"]
             )
             for sid, v in sorted(sku_map.items(), key=lambda x: x[1]["revenue"], reverse=True)[:10]
@@ -141,11 +144,16 @@ async def get_sales_analytics(
     )
 
 
-@router.post("", response_model=Sale, status_code=201)
+@router.post(
+    "",
+    response_model=Sale,
+    status_code=201,
+    openapi_extra=json_body_openapi(SaleCreate)
+)
 async def create_sale(
-    sale: SaleCreate,
     request: Request,
-    current_user: dict = Depends(require_permission(["sales.create"]))
+    current_user: dict = Depends(require_permission(["sales.create"])),
+    sale: SaleCreate = Depends(json_body(SaleCreate))
 ):
     """
     Create a new sale atomically.
@@ -317,21 +325,16 @@ async def list_sales(
     
     result = query.execute()
     
-    sales_with_items = []
+    # Flatten the joined SKU info; the rows are validated in one pass below
     for sale_data in result.data:
-        items_data = sale_data.pop("items", [])
-        items = []
-        for item in items_data:
-            sku_info = item.pop("skus", {})
-            items.append(SaleItemWithSKU(
-                **item,
-                sku_name=sku_info.get("name", ""),
-                sku_code=sku_info.get("code", ""),
-                unit=sku_info.get("unit", "kg")
-            ))
-        sales_with_items.append(SaleWithItems(**sale_data, items=items))
-    
-    return sales_with_items
+        sale_data["items"] = sale_data.get("items") or []
+        for item in sale_data["items"]:
+            sku_info = item.pop("skus", None) or {}
+            item["sku_name"] = sku_info.get("name", "")
+            item["sku_code"] = sku_info.get("code", "")
+            item["unit"] = sku_info.get("unit", "kg")
+    
+    return model_list_response(SaleWithItems, result.data)
 
 
 @router.get("/{sale_id}", response_model=SaleWithItems)
@@ -371,7 +374,7 @@ async def get_sale(
             unit=sku_data.get("unit", "kg")
         ))
     
-    return SaleWithItems(**sale, items=items)
+    return model_response(SaleWithItems(**sale, items=items))
 
 
 @router.get("/summary/daily", response_model=SaleSummary)
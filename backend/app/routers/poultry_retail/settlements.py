@@ -16,10 +16,30 @@ from app.models.poultry_retail.settlements import (
 )
 from app.models.poultry_retail.enums import SettlementStatus
 from app.routers.poultry_retail.utils import validate_store_access
+from app.utils.responses import model_response, model_list_response
 
 router = APIRouter(prefix="/settlements", tags=["Settlements"])
 
 
+def _variance_summary(variance_logs: list) -> dict:
+    """Tally variance log rows into the SettlementWithVariance counters in one pass"""
+    positive = negative = pending = 0
+    for log in variance_logs:
+        variance_type = log["variance_type"]
+        if variance_type == "POSITIVE":
+            positive += 1
+        elif variance_type == "NEGATIVE":
+            negative += 1
+        if log["status"] == "PENDING":
+            pending += 1
+    return {
+        "variance_count": len(variance_logs),
+        "positive_variance_count": positive,
+        "negative_variance_count": negative,
+        "has_pending_variances": pending > 0,
+    }
+
+
 @router.get("/expected")
 async def get_expected_values(
     summary_date: date,
@@ -194,10 +214,6 @@ async def submit_settlement(
         "settlement_id", str(settlement_id)
     ).execute()
     
-    positive_count = sum(1 for v in variance_logs.data if v["variance_type"] == "POSITIVE")
-    negative_count = sum(1 for v in variance_logs.data if v["variance_type"] == "NEGATIVE")
-    pending_count = sum(1 for v in variance_logs.data if v["status"] == "PENDING")
-    
     # Log the transaction
     from app.services.transaction_logger_service import transaction_logger, TransactionAction
     await transaction_logger.log_settlement(
@@ -212,12 +228,8 @@ async def submit_settlement(
         request=request
     )
     
-    return SettlementWithVariance(
-        **updated.data[0],
-        variance_count=len(variance_logs.data),
-        positive_variance_count=positive_count,
-        negative_variance_count=negative_count,
-        has_pending_variances=pending_count > 0
+    return model_response(
+        SettlementWithVariance(**updated.data[0], **_variance_summary(variance_logs.data))
     )
 
 
@@ -447,7 +459,7 @@ async def list_settlements(
     
     result = query.execute()
     
-    return result.data
+    return model_list_response(Settlement, result.data)
 
 
 @router.get("/{settlement_id}", response_model=SettlementWithVariance)
@@ -479,14 +491,6 @@ async def get_settlement(
         "settlement_id", str(settlement_id)
     ).execute()
     
-    positive_count = sum(1 for v in variance_logs.data if v["variance_type"] == "POSITIVE")
-    negative_count = sum(1 for v in variance_logs.data if v["variance_type"] == "NEGATIVE")
-    pending_count = sum(1 for v in variance_logs.data if v["status"] == "PENDING")
-    
-    return SettlementWithVariance(
-        **settlement,
-        variance_count=len(variance_logs.data),
-        positive_variance_count=positive_count,
-        negative_variance_count=negative_count,
-        has_pending_variances=pending_count > 0
+    return model_response(
+        SettlementWithVariance(**settlement, **_variance_summary(variance_logs.data))
     )
@@ -9,10 +9,12 @@ from typing import Optional
 from uuid import UUID
 
 from app.dependencies.rbac import require_permission
+from app.dependencies.body import json_body, json_body_openapi
 from app.models.poultry_retail.suppliers import (
     SupplierCreate, SupplierUpdate, Supplier
 )
 from app.models.poultry_retail.enums import SupplierStatus
+from app.utils.responses import model_list_response
 
 router = APIRouter(prefix="/suppliers", tags=["Suppliers"])
 
@@ -47,7 +49,7 @@ async def list_suppliers(
     
     result = query.execute()
     
-    return result.data
+    return model_list_response(Supplier, result.data)
 
 
 @router.get("/{supplier_id}", response_model=Supplier)
@@ -68,10 +70,15 @@ async def get_supplier(
     return result.data[0]
 
 
-@router.post("", response_model=Supplier, status_code=201)
+@router.post(
+    "",
+    response_model=Supplier,
+    status_code=201,
+    openapi_extra=json_body_openapi(SupplierCreate)
+)
 async def create_supplier(
-    supplier: SupplierCreate,
-    current_user: dict = Depends(require_permission(["suppliers.create"]))
+    current_user: dict = Depends(require_permission(["suppliers.create"])),
+    supplier: SupplierCreate = Depends(json_body(SupplierCreate))
 ):
     """Create a new supplier."""
     from app.config.database import get_supabase
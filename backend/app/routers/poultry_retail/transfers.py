@@ -11,6 +11,8 @@ from uuid import UUID
 from decimal import Decimal
 
 from app.dependencies.rbac import require_permission
+from app.dependencies.body import json_body, json_body_openapi
+from app.utils.responses import model_list_response
 from app.models.poultry_retail.stock_transfers import (
     StockTransferCreate, StockTransfer, StockTransferWithStores,
     TransferReceive, TransferApprove, TransferReject, TransferStatus
@@ -42,11 +44,16 @@ async def list_shops_for_transfer(
     return result.data or []
 
 
-@router.post("", response_model=StockTransfer, status_code=201)
+@router.post(
+    "",
+    response_model=StockTransfer,
+    status_code=201,
+    openapi_extra=json_body_openapi(StockTransferCreate)
+)
 async def create_transfer(
-    transfer: StockTransferCreate,
     request: Request,
-    current_user: dict = Depends(require_permission(["inventory.transfer.create"]))
+    current_user: dict = Depends(require_permission(["inventory.transfer.create"])),
+    transfer: StockTransferCreate = Depends(json_body(StockTransferCreate))
 ):
     """
     Create a new stock transfer.
@@ -86,8 +93,8 @@ async def create_transfer(
     # Check if sender has sufficient stock
     stock_check = supabase.rpc("validate_stock_available", {
         "p_store_id": transfer.from_store_id,
-        "p_bird_type": transfer.bird_type,
-        "p_inventory_type": transfer.inventory_type,
+        "p_bird_type": transfer.bird_type.value,
+        "p_inventory_type": transfer.inventory_type.value,
         "p_required_qty": float(transfer.weight_kg)
     }).execute()
     
@@ -102,8 +109,8 @@ async def create_transfer(
     transfer_data = {
         "from_store_id": transfer.from_store_id,
         "to_store_id": transfer.to_store_id,
-        "bird_type": transfer.bird_type,
-        "inventory_type": transfer.inventory_type,
+        "bird_type": transfer.bird_type.value,
+        "inventory_type": transfer.inventory_type.value,
         "weight_kg": float(transfer.weight_kg),
         "bird_count": transfer.bird_count or 0,
         "transfer_date": transfer_date.isoformat(),
@@ -125,9 +132,9 @@ async def create_transfer(
         action=TransactionAction.CREATE,
         from_store_id=transfer.from_store_id,
         to_store_id=transfer.to_store_id,
-        quantity=Decimal(str(transfer.weight_kg)),
-        bird_type=transfer.bird_type,
-        inventory_type=transfer.inventory_type,
+        quantity=transfer.weight_kg,
+        bird_type=transfer.bird_type.value,
+        inventory_type=transfer.inventory_type.value,
         request=request
     )
     
@@ -211,7 +218,7 @@ async def list_transfers(
         row.pop("to_store", None)
         transfers.append(row)
     
-    return transfers
+    return model_list_response(StockTransferWithStores, transfers)
 
 
 @router.get("/{transfer_id}", response_model=StockTransferWithStores)
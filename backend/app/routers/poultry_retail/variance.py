@@ -5,17 +5,22 @@ API endpoints for variance management and approval.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from pydantic import TypeAdapter
 from typing import Optional
 from uuid import UUID
 
 from app.dependencies.rbac import require_permission
 from app.models.poultry_retail.variance import (
-    VarianceLog, VarianceLogWithDetails, VarianceApproval, VarianceDeduction
+    VarianceLog, VarianceLogWithDetails, VarianceApproval, VarianceDeduction,
+    VarianceListResponse
 )
 from app.models.poultry_retail.enums import VarianceType, VarianceLogStatus
+from app.utils.responses import model_list_response, model_response
 
 router = APIRouter(prefix="/variance", tags=["Variance"])
 
+_variance_page_adapter = TypeAdapter(VarianceListResponse)
+
 
 def validate_store_access(store_id: int, user: dict) -> bool:
     """Check if user has access to the store."""
@@ -77,16 +82,57 @@ async def list_variances(
         submitter = settlement.pop("profiles", {})
         resolver = row.pop("profiles", {})
         
-        variances.append(VarianceLogWithDetails(
+        variances.append({
             **row,
-            store_id=settlement.get("store_id") or shop.get("id"),
-            store_name=shop.get("name", "Unknown"),
-            settlement_date=settlement.get("settlement_date"),
-            submitted_by_name=submitter.get("full_name"),
-            resolved_by_name=resolver.get("full_name")
-        ))
-    
-    return variances
+            "store_id": settlement.get("store_id") or shop.get("id"),
+            "store_name": shop.get("name", "Unknown"),
+            "settlement_date": settlement.get("settlement_date"),
+            "submitted_by_name": submitter.get("full_name"),
+            "resolved_by_name": resolver.get("full_name"),
+        })
+    
+    return model_list_response(VarianceLogWithDetails, variances)
+
+
+@router.get("/page", response_model=VarianceListResponse)
+async def get_variance_page(
+    x_store_id: Optional[int] = Header(None, description="Store ID for context"),
+    status: Optional[VarianceLogStatus] = None,
+    variance_type: Optional[VarianceType] = None,
+    limit: int = Query(default=50, le=100),
+    offset: int = 0,
+    current_user: dict = Depends(require_permission(["variance.view"]))
+):
+    """
+    Page of variance logs with the filtered total and pending count.
+    
+    Items, total and pending_count come back from a single RPC call
+    (get_variance_page) that scans the filtered rows once.
+    """
+    from app.config.database import get_supabase
+    
+    supabase = get_supabase()
+    
+    store_ids = None
+    if x_store_id:
+        if not validate_store_access(x_store_id, current_user):
+            raise HTTPException(status_code=403, detail="Access denied to this store")
+        store_ids = [x_store_id]
+    elif "Admin" not in current_user.get("roles", []):
+        # Non-admin must filter by their stores
+        store_ids = current_user.get("store_ids", [])
+        if not store_ids:
+            return VarianceListResponse(items=[], total=0, pending_count=0)
+    
+    result = supabase.rpc("get_variance_page", {
+        "p_store_ids": store_ids,
+        "p_status": status.value if status else None,
+        "p_variance_type": variance_type.value if variance_type else None,
+        "p_limit": limit,
+        "p_offset": offset,
+    }).execute()
+    
+    return model_response(_variance_page_adapter.validate_python(result.data))
 
 
 @router.get("/{variance_id}", response_model=VarianceLogWithDetails)
@@ -11,7 +11,7 @@ from datetime import datetime
 import httpx
 
 from app.config.settings import settings
-from app.services.supabase_client import supabase_client
+from app.services.supabase_client import supabase_client, execute_async
 from app.services.role_service import RoleService
 
 logger = logging.getLogger(__name__)
@@ -274,7 +274,7 @@ class DatabaseTools:
                             except: pass
                         query = query.eq(key, value)
                 
-                result = query.execute()
+                result = await execute_async(query)
                 return json.dumps({"data": result.data, "count": len(result.data)})
             
             elif tool_name == "count_rows":
@@ -285,20 +285,20 @@ class DatabaseTools:
                 for key, value in filters.items():
                     query = query.eq(key, value)
                 
-                result = query.execute()
+                result = await execute_async(query)
                 return json.dumps({"count": result.count or len(result.data)})
             
             elif tool_name == "get_schema_info":
                 # Enhanced discovery: Use RPC if available, fallback to sample row
                 try:
-                    rpc_result = supabase_client.rpc('get_table_metadata', {'p_table_name': table}).execute()
+                    rpc_result = await execute_async(supabase_client.rpc('get_table_metadata', {'p_table_name': table}))
                     if rpc_result.data:
                         return json.dumps(rpc_result.data)
                 except Exception as rpc_err:
                     logger.debug(f"RPC get_table_metadata failed: {rpc_err}")
                 
                 # Fallback to inference
-                result = supabase_client.table(table).select("*").limit(1).execute()
+                result = await execute_async(supabase_client.table(table).select("*").limit(1))
                 if result.data:
                     return json.dumps({
                         "table": table,
@@ -339,11 +339,11 @@ class DatabaseTools:
                 
                 embedding = await knowledge_service.get_embedding(content)
                 if embedding:
-                    db_res = supabase_client.table('knowledge_base').insert({
+                    db_res = await execute_async(supabase_client.table('knowledge_base').insert({
                         "content": content,
                         "metadata": metadata,
                         "embedding": embedding
-                    }).execute()
+                    }))
                     return json.dumps({"status": "success", "message": "Knowledge recorded successfully.", "id": db_res.data[0]['id'] if db_res.data else None})
                 return json.dumps({"status": "error", "message": "Failed to generate embedding for new knowledge."})
 
@@ -357,7 +357,7 @@ class DatabaseTools:
                 
                 # DB Latency check
                 db_start = time.time()
-                supabase_client.table("profiles").select("id").limit(1).execute()
+                await execute_async(supabase_client.table("profiles").select("id").limit(1))
                 db_latency = (time.time() - db_start) * 1000
                 
                 return json.dumps({
@@ -393,7 +393,7 @@ class AIService:
         """Get AI configuration for user based on their roles"""
         
         # Get user's role IDs
-        user_roles = supabase_client.table('user_roles').select('role_id').eq('user_id', user_id).execute()
+        user_roles = await execute_async(supabase_client.table('user_roles').select('role_id').eq('user_id', user_id))
         
         if not user_roles.data:
             return None
@@ -401,7 +401,7 @@ class AIService:
         role_ids = [r['role_id'] for r in user_roles.data]
         
         # Get best config (most permissive)
-        configs = supabase_client.table('ai_agent_configs').select('*').in_('role_id', role_ids).eq('enabled', True).execute()
+        configs = await execute_async(supabase_client.table('ai_agent_configs').select('*').in_('role_id', role_ids).eq('enabled', True))
         
         if not configs.data:
             return None
@@ -430,21 +430,21 @@ class AIService:
     
     async def create_conversation(self, user_id: str, title: str = "New Conversation") -> Dict:
         """Create a new conversation"""
-        result = supabase_client.table('ai_conversations').insert({
+        result = await execute_async(supabase_client.table('ai_conversations').insert({
             "user_id": user_id,
             "title": title
-        }).execute()
+        }))
         
         return result.data[0] if result.data else {}
     
     async def get_conversations(self, user_id: str) -> List[Dict]:
         """Get user's conversations"""
-        result = supabase_client.table('ai_conversations').select('*').eq('user_id', user_id).order('updated_at', desc=True).limit(50).execute()
+        result = await execute_async(supabase_client.table('ai_conversations').select('*').eq('user_id', user_id).order('updated_at', desc=True).limit(50))
         return result.data or []
     
     async def update_conversation_title(self, conversation_id: str, title: str) -> bool:
         """Update a conversation's title"""
-        result = supabase_client.table('ai_conversations').update({"title": title}).eq('id', conversation_id).execute()
+        result = await execute_async(supabase_client.table('ai_conversations').update({"title": title}).eq('id', conversation_id))
         return bool(result.data)
     
     async def generate_conversation_title(self, conversation_id: str, first_message: str):
@@ -466,7 +466,7 @@ class AIService:
 
     async def get_messages(self, conversation_id: str) -> List[Dict]:
         """Get messages for a conversation"""
-        result = supabase_client.table('ai_messages').select('*').eq('conversation_id', conversation_id).order('created_at').execute()
+        result = await execute_async(supabase_client.table('ai_messages').select('*').eq('conversation_id', conversation_id).order('created_at'))
         return result.data or []
     
     async def add_message(
@@ -489,10 +489,10 @@ class AIService:
         if tool_call_id:
             data["tool_call_id"] = tool_call_id
         
-        result = supabase_client.table('ai_messages').insert(data).execute()
+        result = await execute_async(supabase_client.table('ai_messages').insert(data))
         
         # Update conversation updated_at
-        supabase_client.table('ai_conversations').update({"updated_at": datetime.utcnow().isoformat()}).eq('id', conversation_id).execute()
+        await execute_async(supabase_client.table('ai_conversations').update({"updated_at": datetime.utcnow().isoformat()}).eq('id', conversation_id))
         
         return result.data[0] if result.data else {}
     
@@ -752,7 +752,7 @@ You are a trusted enterprise AI assistant. Your responses should reflect profess
 
     async def delete_conversation(self, user_id: str, conversation_id: str) -> bool:
         """Delete a conversation (verifies ownership)"""
-        result = supabase_client.table('ai_conversations').delete().eq('id', conversation_id).eq('user_id', user_id).execute()
+        result = await execute_async(supabase_client.table('ai_conversations').delete().eq('id', conversation_id).eq('user_id', user_id))
         return bool(result.data)
 
 
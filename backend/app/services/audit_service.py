@@ -4,9 +4,41 @@ Audit Log Service
 Tracks all system changes and user actions
 """
 
+import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
-from app.services.supabase_client import supabase_client
+from typing import Optional, Dict, Any, List
+from app.services.batch_writer import BatchWriter
+from app.services.supabase_client import supabase_client, execute_async
+
+logger = logging.getLogger(__name__)
+
+
+async def _write_audit_batch(batch: List[dict]) -> None:
+    """
+    Insert a batch of audit entries with one multi-row insert.
+    
+    If the batch fails its rows are retried one at a time, so a single bad
+    entry does not take the rest with it.
+    """
+    # Don't fail the main operation if logging fails
+    try:
+        await execute_async(supabase_client.table("audit_logs").insert(batch))
+        return
+    except Exception as e:
+        if len(batch) == 1:
+            logger.error(f"Audit log error ({batch[0].get('action')}): {str(e)}")
+            return
+        logger.warning(f"Audit batch insert failed ({len(batch)} entries), retrying one at a time: {str(e)}")
+    
+    for entry in batch:
+        try:
+            await execute_async(supabase_client.table("audit_logs").insert([entry]))
+        except Exception as e:
+            logger.error(f"Audit log error ({entry.get('action')}): {str(e)}")
+
+
+# log_action only enqueues; entries are inserted in background batches
+audit_writer = BatchWriter(_write_audit_batch, batch_size=256)
 
 
 class AuditLogger:
@@ -26,6 +58,9 @@ class AuditLogger:
         """
         Log an audit event
         
+        The entry is queued on audit_writer and inserted in the background
+        with other pending entries; this returns without a database call.
+        
         Args:
             user_id: ID of the user performing the action
             action: Type of action (CREATE, UPDATE, DELETE, etc.)
@@ -34,28 +69,19 @@ class AuditLogger:
             changes: Dictionary of what changed (before/after)
             metadata: Additional context
         """
-        try:
-            log_entry = {
-                "user_id": user_id,
-                "action": action,
-                "resource_type": resource_type,
-                "resource_id": resource_id,
-                "changes": changes or {},
-                "metadata": metadata or {},
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Insert into audit_logs table
-            result = supabase_client.table("audit_logs").insert(log_entry).execute()
-            
-            return result.data[0] if result.data else None
-            
-        except Exception as e:
-            # Don't fail the main operation if logging fails
-            print(f"Audit log error: {str(e)}")
-            return None
+        queued = audit_writer.enqueue({
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "changes": changes or {},
+            "metadata": metadata or {},
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        if not queued:
+            logger.warning("Audit queue full, dropped %s entry", action)
     
     @staticmethod
     def compare_objects(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
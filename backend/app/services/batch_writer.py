@@ -0,0 +1,107 @@
+"""
+Batch Writer
+============
+Background queue that groups fire-and-forget rows into batched writes.
+
+Callers enqueue rows without waiting for the database; a worker task drains
+the queue in batches and hands each batch to a write callback (typically a
+single multi-row insert or upsert). Used for session activity and audit logs.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queued by BatchWriter.stop(); the worker exits once it reaches it
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    Bounded queue plus worker task that writes rows in batches.
+
+    A batch is written when it reaches ``batch_size`` rows or
+    ``flush_interval`` seconds after its first row, whichever comes first.
+    When the queue is full the row is dropped and counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[dict]], Awaitable[None]],
+        maxsize: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+    ):
+        self.write = write
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, row: dict) -> bool:
+        """Queue a row without waiting for the database; False if it was dropped"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    async def _next_batch(self) -> Tuple[List[dict], bool]:
+        """
+        Wait for one row, then collect more until the batch is full or the
+        interval passes. The flag is True once the stop marker was reached.
+        """
+        row = await self._queue.get()
+        if row is _STOP:
+            return [], True
+        batch = [row]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if row is _STOP:
+                return batch, True
+            batch.append(row)
+        return batch, False
+
+    async def _run(self) -> None:
+        while True:
+            batch, stopping = await self._next_batch()
+            if batch:
+                try:
+                    await self.write(batch)
+                except Exception as e:
+                    # Keep the worker alive; the callback owns error handling
+                    logger.error(f"Batch write failed ({len(batch)} rows): {str(e)}")
+            if stopping:
+                return
+
+    async def stop(self) -> None:
+        """
+        Stop the worker once everything queued so far has been written.
+
+        The stop marker goes to the back of the queue, so the worker finishes
+        the batch it is assembling or writing and every row ahead of the
+        marker before it exits.
+        """
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.put(_STOP)
+            await self._task
+        self._task = None
@@ -0,0 +1,102 @@
+"""
+Cache Invalidation
+==================
+Listens to Supabase realtime changes on the authorization tables and drops
+the matching in-process caches as soon as a row changes, including writes
+made by other workers or directly in the database.
+
+While the subscription is live the rate limit config cache uses a long TTL;
+if the channel errors or closes it falls back to the short polling TTL.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, Optional
+
+from realtime import AsyncRealtimeClient, RealtimeSubscribeStates
+
+from app.config.settings import settings
+from app.middleware.rate_limiter import rate_limit_config_cache
+from app.services.role_service import invalidate_user_authz
+
+logger = logging.getLogger(__name__)
+
+# Rate limit config TTL while realtime invalidation is live (fallback only)
+RATE_LIMIT_CONFIG_PUSH_TTL = 3600
+RATE_LIMIT_CONFIG_POLL_TTL = rate_limit_config_cache.ttl
+
+CHANNEL_TOPIC = 'cache-invalidation'
+
+
+def _invalidate_rate_limits(_payload) -> None:
+    rate_limit_config_cache.invalidate()
+
+
+def _invalidate_authz(_payload) -> None:
+    invalidate_user_authz()
+
+
+# Table -> cache invalidation callback
+WATCHED_TABLES: Dict[str, Callable] = {
+    'rate_limit_configs': _invalidate_rate_limits,
+    'roles': _invalidate_authz,
+    'permissions': _invalidate_authz,
+    'role_permissions': _invalidate_authz,
+    'user_roles': _invalidate_authz,
+    'user_shops': _invalidate_authz,
+}
+
+
+class CacheInvalidationListener:
+    """Background subscription that invalidates caches on table changes"""
+
+    def __init__(self):
+        self._client: Optional[AsyncRealtimeClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start subscribing in the background (startup does not wait on the socket)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._subscribe())
+
+    async def stop(self) -> None:
+        """Close the subscription"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception as e:
+                logger.debug("Realtime client close error: %s", e)
+            self._client = None
+        rate_limit_config_cache.ttl = RATE_LIMIT_CONFIG_POLL_TTL
+
+    async def _subscribe(self) -> None:
+        try:
+            self._client = AsyncRealtimeClient(
+                f"{settings.SUPABASE_URL}/realtime/v1",
+                token=settings.SUPABASE_SERVICE_ROLE_KEY,
+            )
+            channel = self._client.channel(CHANNEL_TOPIC)
+            for table, callback in WATCHED_TABLES.items():
+                channel.on_postgres_changes('*', callback, table=table, schema='public')
+            await channel.subscribe(self._on_state_change)
+        except Exception as e:
+            logger.warning(f"Realtime cache invalidation unavailable, using TTL polling: {e}")
+
+    @staticmethod
+    def _on_state_change(state: RealtimeSubscribeStates, error: Optional[Exception]) -> None:
+        if state == RealtimeSubscribeStates.SUBSCRIBED:
+            rate_limit_config_cache.ttl = RATE_LIMIT_CONFIG_PUSH_TTL
+            logger.info("Realtime cache invalidation subscribed")
+        else:
+            # Changes may have been missed: drop the caches and poll again
+            rate_limit_config_cache.ttl = RATE_LIMIT_CONFIG_POLL_TTL
+            rate_limit_config_cache.invalidate()
+            invalidate_user_authz()
+            logger.warning(f"Realtime cache invalidation {state.value}: {error}")
+
+
+# Global instance
+cache_invalidation_listener = CacheInvalidationListener()
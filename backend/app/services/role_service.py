@@ -4,15 +4,32 @@ Role Service
 Business logic for role and permission management operations.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import asyncio
 import logging
+import time
 
-from app.services.supabase_client import supabase_client
+from app.services.supabase_client import supabase_client, execute_async
 from app.models.role import RoleCreate, RoleUpdate
 from app.models.permission import PermissionCreate, PermissionUpdate
 
 logger = logging.getLogger(__name__)
 
+# Short-lived per-user cache of get_user_auth_bundle results. Role and
+# permission data changes far less often than it is read, and every mutation
+# below invalidates it, so staleness is bounded by writes rather than the TTL.
+AUTH_BUNDLE_CACHE_TTL = 15
+AUTH_BUNDLE_CACHE_MAXSIZE = 50_000
+_auth_bundle_cache: Dict[str, Tuple[Dict, float]] = {}
+
+
+def invalidate_user_authz(user_id: Optional[str] = None) -> None:
+    """Drop cached authorization data for one user, or for everyone if no user is given"""
+    if user_id is None:
+        _auth_bundle_cache.clear()
+    else:
+        _auth_bundle_cache.pop(user_id, None)
+
 
 class RoleService:
     """Service for role and permission operations"""
@@ -27,7 +44,8 @@ class RoleService:
     async def get_all_roles(self) -> List[Dict]:
         """Get all roles"""
         try:
-            response = self.client.table("roles").select("*").execute()
+            query = self.client.table("roles").select("*")
+            response = await execute_async(query)
             return response.data
         except Exception as e:
             logger.error(f"Error fetching roles: {str(e)}")
@@ -36,8 +54,9 @@ class RoleService:
     async def get_role_by_id(self, role_id: int) -> Optional[Dict]:
         """Get role by ID"""
         try:
-            response = self.client.table("roles").select("*").eq("id", role_id).single().execute()
-            return response.data
+            query = self.client.table("roles").select("*").eq("id", role_id).maybe_single()
+            response = await execute_async(query)
+            return response.data if response else None
         except Exception as e:
             logger.error(f"Error fetching role {role_id}: {str(e)}")
             return None
@@ -45,7 +64,7 @@ class RoleService:
     async def create_role(self, role_data: RoleCreate) -> Dict:
         """Create a new role"""
         try:
-            response = self.client.table("roles").insert(role_data.dict()).execute()
+            response = await execute_async(self.client.table("roles").insert(role_data.dict()))
             return response.data[0]
         except Exception as e:
             logger.error(f"Error creating role: {str(e)}")
@@ -58,7 +77,9 @@ class RoleService:
             if not update_data:
                 return await self.get_role_by_id(role_id)
             
-            response = self.client.table("roles").update(update_data).eq("id", role_id).execute()
+            query = self.client.table("roles").update(update_data).eq("id", role_id)
+            response = await execute_async(query)
+            invalidate_user_authz()
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error updating role {role_id}: {str(e)}")
@@ -67,7 +88,8 @@ class RoleService:
     async def delete_role(self, role_id: int) -> bool:
         """Delete a role"""
         try:
-            self.client.table("roles").delete().eq("id", role_id).execute()
+            await execute_async(self.client.table("roles").delete().eq("id", role_id))
+            invalidate_user_authz()
             return True
         except Exception as e:
             logger.error(f"Error deleting role {role_id}: {str(e)}")
@@ -78,26 +100,50 @@ class RoleService:
     # =============================================================================
     
     async def get_user_roles(self, user_id: str) -> List[Dict]:
-        """Get all roles assigned to a user"""
+        """
+        Get all roles assigned to a user.
+        
+        Served from the cached auth bundle, so a request that already passed
+        an RBAC check does not query the roles again.
+        """
+        return list((await self.get_user_auth_bundle(user_id))["roles"])
+    
+    async def _query_user_roles(self, user_id: str) -> List[Dict]:
+        """Load a user's roles from the database (auth bundle fallback, raises on error)"""
+        query = (
+            self.client.table("user_roles")
+            .select("role_id, roles(id, name, description)")
+            .eq("user_id", user_id)
+        )
+        response = await execute_async(query)
+        return [item["roles"] for item in response.data if item.get("roles")]
+    
+    async def get_roles_for_users(self, user_ids: List[str]) -> Dict[str, List[str]]:
+        """Get role names for many users in one query, keyed by user id"""
+        role_map: Dict[str, List[str]] = {user_id: [] for user_id in user_ids}
+        if not user_ids:
+            return role_map
         try:
-            response = (
+            response = await execute_async(
                 self.client.table("user_roles")
-                .select("role_id, roles(id, name, description)")
-                .eq("user_id", user_id)
-                .execute()
+                .select("user_id, roles(name)")
+                .in_("user_id", user_ids)
             )
-            return [item["roles"] for item in response.data if item.get("roles")]
+            for item in response.data:
+                if item.get("roles"):
+                    role_map.setdefault(item["user_id"], []).append(item["roles"]["name"])
         except Exception as e:
-            logger.error(f"Error fetching user roles: {str(e)}")
-            return []
+            logger.error(f"Error fetching roles for users: {str(e)}")
+        return role_map
     
     async def assign_role_to_user(self, user_id: str, role_id: int) -> bool:
         """Assign a role to a user"""
         try:
-            self.client.table("user_roles").insert({
+            await execute_async(self.client.table("user_roles").insert({
                 "user_id": user_id,
                 "role_id": role_id
-            }).execute()
+            }))
+            invalidate_user_authz(user_id)
             return True
         except Exception as e:
             logger.error(f"Error assigning role to user: {str(e)}")
@@ -106,10 +152,11 @@ class RoleService:
     async def remove_role_from_user(self, user_id: str, role_id: int) -> bool:
         """Remove a role from a user"""
         try:
-            self.client.table("user_roles").delete().match({
+            await execute_async(self.client.table("user_roles").delete().match({
                 "user_id": user_id,
                 "role_id": role_id
-            }).execute()
+            }))
+            invalidate_user_authz(user_id)
             return True
         except Exception as e:
             logger.error(f"Error removing role from user: {str(e)}")
@@ -122,7 +169,8 @@ class RoleService:
     async def get_all_permissions(self) -> List[Dict]:
         """Get all permissions"""
         try:
-            response = self.client.table("permissions").select("*").execute()
+            query = self.client.table("permissions").select("*")
+            response = await execute_async(query)
             return response.data
         except Exception as e:
             logger.error(f"Error fetching permissions: {str(e)}")
@@ -131,8 +179,9 @@ class RoleService:
     async def get_permission_by_id(self, permission_id: int) -> Optional[Dict]:
         """Get permission by ID"""
         try:
-            response = self.client.table("permissions").select("*").eq("id", permission_id).single().execute()
-            return response.data
+            query = self.client.table("permissions").select("*").eq("id", permission_id).maybe_single()
+            response = await execute_async(query)
+            return response.data if response else None
         except Exception as e:
             logger.error(f"Error fetching permission {permission_id}: {str(e)}")
             return None
@@ -140,7 +189,8 @@ class RoleService:
     async def create_permission(self, permission_data: PermissionCreate) -> Dict:
         """Create a new permission"""
         try:
-            response = self.client.table("permissions").insert(permission_data.dict()).execute()
+            query = self.client.table("permissions").insert(permission_data.dict())
+            response = await execute_async(query)
             return response.data[0]
         except Exception as e:
             logger.error(f"Error creating permission: {str(e)}")
@@ -153,7 +203,9 @@ class RoleService:
             if not update_data:
                 return await self.get_permission_by_id(permission_id)
             
-            response = self.client.table("permissions").update(update_data).eq("id", permission_id).execute()
+            query = self.client.table("permissions").update(update_data).eq("id", permission_id)
+            response = await execute_async(query)
+            invalidate_user_authz()
             return response.data[0] if response.data else None
         except Exception as e:
             logger.error(f"Error updating permission {permission_id}: {str(e)}")
@@ -162,7 +214,8 @@ class RoleService:
     async def delete_permission(self, permission_id: int) -> bool:
         """Delete a permission"""
         try:
-            self.client.table("permissions").delete().eq("id", permission_id).execute()
+            await execute_async(self.client.table("permissions").delete().eq("id", permission_id))
+            invalidate_user_authz()
             return True
         except Exception as e:
             logger.error(f"Error deleting permission {permission_id}: {str(e)}")
@@ -175,33 +228,48 @@ class RoleService:
     async def get_role_permissions(self, role_id: int) -> List[str]:
         """Get all permissions for a role"""
         try:
-            response = (
+            response = await execute_async(
                 self.client.table("role_permissions")
                 .select("permissions(key)")
                 .eq("role_id", role_id)
-                .execute()
             )
             return [item["permissions"]["key"] for item in response.data if item.get("permissions")]
         except Exception as e:
             logger.error(f"Error fetching role permissions: {str(e)}")
             return []
     
-    async def get_user_permissions(self, user_id: str) -> List[str]:
-        """Get all permissions for a user (through their roles)"""
+    async def get_all_roles_with_permissions(self) -> List[Dict]:
+        """Get all roles with their permission keys (aggregated in the database)"""
         try:
-            response = self.client.rpc("get_user_permissions", {"user_id": user_id}).execute()
-            return [item["permission_key"] for item in response.data]
+            response = await execute_async(self.client.table("roles_with_permissions").select("*"))
+            return response.data
         except Exception as e:
-            logger.error(f"Error fetching user permissions: {str(e)}")
+            logger.error(f"Error fetching roles with permissions: {str(e)}")
             return []
     
+    async def get_user_permissions(self, user_id: str) -> List[str]:
+        """
+        Get all permissions for a user (through their roles).
+        
+        Served from the cached auth bundle, so a request that already passed
+        an RBAC check does not query the permissions again.
+        """
+        return list((await self.get_user_auth_bundle(user_id))["permissions"])
+    
+    async def _query_user_permissions(self, user_id: str) -> List[str]:
+        """Load a user's permission keys from the database (auth bundle fallback, raises on error)"""
+        query = self.client.rpc("get_user_permissions", {"user_id": user_id})
+        response = await execute_async(query)
+        return [item["permission_key"] for item in response.data]
+    
     async def assign_permission_to_role(self, role_id: int, permission_id: int) -> bool:
         """Assign a permission to a role"""
         try:
-            self.client.table("role_permissions").insert({
+            await execute_async(self.client.table("role_permissions").insert({
                 "role_id": role_id,
                 "permission_id": permission_id
-            }).execute()
+            }))
+            invalidate_user_authz()
             return True
         except Exception as e:
             logger.error(f"Error assigning permission to role: {str(e)}")
@@ -210,10 +278,11 @@ class RoleService:
     async def remove_permission_from_role(self, role_id: int, permission_id: int) -> bool:
         """Remove a permission from a role"""
         try:
-            self.client.table("role_permissions").delete().match({
+            await execute_async(self.client.table("role_permissions").delete().match({
                 "role_id": role_id,
                 "permission_id": permission_id
-            }).execute()
+            }))
+            invalidate_user_authz()
             return True
         except Exception as e:
             logger.error(f"Error removing permission from role: {str(e)}")
@@ -221,13 +290,58 @@ class RoleService:
     async def get_user_store_ids(self, user_id: str) -> List[int]:
         """Get IDs of all shops assigned to a user"""
         try:
-            response = (
-                self.client.table("user_shops")
-                .select("shop_id")
-                .eq("user_id", user_id)
-                .execute()
-            )
-            return [item["shop_id"] for item in response.data]
+            return await self._query_user_store_ids(user_id)
         except Exception as e:
             logger.error(f"Error fetching user shop IDs: {str(e)}")
             return []
+    
+    async def _query_user_store_ids(self, user_id: str) -> List[int]:
+        """Load a user's shop IDs from the database (raises on error)"""
+        query = self.client.table("user_shops").select("shop_id").eq("user_id", user_id)
+        response = await execute_async(query)
+        return [item["shop_id"] for item in response.data]
+    
+    async def get_user_auth_bundle(self, user_id: str) -> Dict:
+        """
+        Get permissions, roles and store IDs for a user in one round-trip.
+        
+        Falls back to the individual lookups if the get_user_auth_bundle RPC
+        (migration 092) is not available. Results are cached per user for
+        AUTH_BUNDLE_CACHE_TTL seconds; if loading fails an empty bundle is
+        returned and nothing is cached, so the next request retries.
+        """
+        cached = _auth_bundle_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[1] < AUTH_BUNDLE_CACHE_TTL:
+            return cached[0]
+        
+        try:
+            bundle = await self._fetch_user_auth_bundle(user_id)
+        except Exception as e:
+            logger.error(f"Error fetching auth bundle for user {user_id}: {str(e)}")
+            return {"permissions": [], "roles": [], "store_ids": []}
+        if len(_auth_bundle_cache) >= AUTH_BUNDLE_CACHE_MAXSIZE:
+            _auth_bundle_cache.pop(next(iter(_auth_bundle_cache)), None)
+        _auth_bundle_cache[user_id] = (bundle, time.monotonic())
+        return bundle
+    
+    async def _fetch_user_auth_bundle(self, user_id: str) -> Dict:
+        """Load the authorization bundle for a user from the database (raises on error)"""
+        try:
+            response = await execute_async(
+                self.client.rpc("get_user_auth_bundle", {"p_user_id": user_id})
+            )
+            bundle = response.data or {}
+            return {
+                "permissions": bundle.get("permissions") or [],
+                "roles": bundle.get("roles") or [],
+                "store_ids": bundle.get("store_ids") or [],
+            }
+        except Exception as e:
+            logger.warning(f"get_user_auth_bundle RPC unavailable, using separate queries: {str(e)}")
+        
+        permissions, roles, store_ids = await asyncio.gather(
+            self._query_user_permissions(user_id),
+            self._query_user_roles(user_id),
+            self._query_user_store_ids(user_id),
+        )
+        return {"permissions": permissions, "roles": roles, "store_ids": store_ids}
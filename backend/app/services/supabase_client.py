@@ -4,12 +4,25 @@ Supabase Client
 Singleton client for interacting with Supabase.
 """
 
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from app.config.settings import settings
+import asyncio
+import httpx
 import logging
 
 logger = logging.getLogger(__name__)
 
+# One pooled HTTP/2 client shared by PostgREST and Auth. Connections are kept
+# alive across requests (and idle gaps up to keepalive_expiry), so only the
+# first call per connection pays the TCP/TLS handshake. Sized for the
+# default asyncio.to_thread pool that runs the blocking calls.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
 
 class SupabaseClient:
     """Singleton Supabase client wrapper"""
@@ -21,12 +34,31 @@ class SupabaseClient:
         """Get or create Supabase client instance"""
         if cls._instance is None:
             logger.info("Initializing Supabase client")
+            http_client = httpx.Client(
+                http2=True,
+                limits=HTTP_LIMITS,
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+            )
             cls._instance = create_client(
                 settings.SUPABASE_URL,
-                settings.SUPABASE_SERVICE_ROLE_KEY
+                settings.SUPABASE_SERVICE_ROLE_KEY,
+                options=ClientOptions(httpx_client=http_client),
             )
+            logger.debug("Supabase client created: id=%s", id(cls._instance))
         return cls._instance
 
 
 # Global instance
 supabase_client = SupabaseClient.get_client()
+
+
+async def execute_async(query):
+    """
+    Run a query builder's blocking ``execute()`` in a worker thread.
+    
+    The client is synchronous; awaiting this instead of calling
+    ``query.execute()`` directly keeps the event loop free for other
+    requests while the HTTP round-trip is in flight.
+    """
+    return await asyncio.to_thread(query.execute)
@@ -5,9 +5,10 @@ Business logic for user management operations.
 """
 
 from typing import List, Optional, Dict
+import asyncio
 import logging
 
-from app.services.supabase_client import supabase_client
+from app.services.supabase_client import supabase_client, execute_async
 from app.models.user import UserCreate, UserUpdate, UserProfile
 
 logger = logging.getLogger(__name__)
@@ -22,8 +23,9 @@ class UserService:
     async def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """Get user profile by ID"""
         try:
-            response = self.client.table("profiles").select("*").eq("id", user_id).single().execute()
-            return response.data
+            query = self.client.table("profiles").select("*").eq("id", user_id).maybe_single()
+            response = await execute_async(query)
+            return response.data if response else None
         except Exception as e:
             logger.error(f"Error fetching user {user_id}: {str(e)}")
             return None
@@ -31,8 +33,9 @@ class UserService:
     async def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user profile by email"""
         try:
-            response = self.client.table("profiles").select("*").eq("email", email).single().execute()
-            return response.data
+            query = self.client.table("profiles").select("*").eq("email", email).maybe_single()
+            response = await execute_async(query)
+            return response.data if response else None
         except Exception as e:
             logger.error(f"Error fetching user by email {email}: {str(e)}")
             return None
@@ -40,12 +43,12 @@ class UserService:
     async def get_all_users(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """Get all users with pagination"""
         try:
-            response = (
+            query = (
                 self.client.table("profiles")
                 .select("*")
                 .range(offset, offset + limit - 1)
-                .execute()
             )
+            response = await execute_async(query)
             return response.data
         except Exception as e:
             logger.error(f"Error fetching users: {str(e)}")
@@ -60,11 +63,10 @@ class UserService:
             if not update_data:
                 return await self.get_user_by_id(user_id)
             
-            response = (
+            response = await execute_async(
                 self.client.table("profiles")
                 .update(update_data)
                 .eq("id", user_id)
-                .execute()
             )
             return response.data[0] if response.data else None
         except Exception as e:
@@ -76,7 +78,7 @@ class UserService:
         try:
             # In production, implement soft delete by adding a 'deleted_at' field
             # For now, we'll delete from auth which cascades to profiles
-            self.client.auth.admin.delete_user(user_id)
+            await asyncio.to_thread(self.client.auth.admin.delete_user, user_id)
             return True
         except Exception as e:
             logger.error(f"Error deleting user {user_id}: {str(e)}")
@@ -85,11 +87,10 @@ class UserService:
     async def search_users(self, query: str) -> List[Dict]:
         """Search users by email or name"""
         try:
-            response = (
+            response = await execute_async(
                 self.client.table("profiles")
                 .select("*")
                 .or_(f"email.ilike.%{query}%,full_name.ilike.%{query}%")
-                .execute()
             )
             return response.data
         except Exception as e:
@@ -9,8 +9,15 @@ import sys
 from app.config.settings import settings
 
 
+_CONFIGURED = False
+
+
 def setup_logging():
-    """Configure logging for the application"""
+    """Configure logging for the application (safe to call more than once)"""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
     
     # Create formatter
     formatter = logging.Formatter(
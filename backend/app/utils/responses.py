@@ -0,0 +1,65 @@
+"""
+Model Responses
+===============
+Helpers for returning Pydantic response models without FastAPI's extra
+serialization pass.
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> ORJSONResponse:
+    """
+    Serialize a response model once and return it as an orjson response.
+
+    ``model_dump(mode="json")`` runs every field serializer (e.g. Decimal ->
+    float on StockByType) in pydantic-core, and orjson writes the resulting
+    plain dict to bytes. Returning a Response directly means FastAPI skips
+    dumping, re-validating and re-encoding the model for ``response_model``;
+    the route's ``response_model`` still documents the schema.
+
+    Args:
+        model: Already-validated response model instance
+        status_code: HTTP status code of the response
+
+    Returns:
+        ORJSONResponse with the model's JSON representation
+    """
+    return ORJSONResponse(model.model_dump(mode="json"), status_code=status_code)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per model) the adapter for a list of ``model``"""
+    return TypeAdapter(List[model])
+
+
+def model_list_response(
+    model: Type[BaseModel], rows: Iterable[Any], status_code: int = 200
+) -> Response:
+    """
+    Validate raw rows as a list of ``model`` and return them as JSON.
+
+    Validation and JSON encoding of the whole list each happen in a single
+    pydantic-core call, instead of FastAPI dumping, re-validating and
+    re-encoding every row for ``response_model=list[model]``.
+
+    Args:
+        model: Response model for each row
+        rows: Row dicts (e.g. ``result.data``) or model instances
+        status_code: HTTP status code of the response
+
+    Returns:
+        JSON response with the validated rows
+    """
+    adapter = _list_adapter(model)
+    return Response(
+        adapter.dump_json(adapter.validate_python(list(rows))),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,41 @@
+-- =============================================================================
+-- USER AUTHORIZATION BUNDLE RPC
+-- =============================================================================
+-- Migration: 092_get_user_auth_bundle.sql
+-- Description: Returns a user's permission keys, roles and assigned store IDs
+--              in a single call so RBAC checks need one round-trip, not three
+-- Date: 2026-01-25
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_user_auth_bundle(p_user_id UUID)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'permissions', COALESCE((
+            SELECT jsonb_agg(DISTINCT p.key)
+            FROM public.user_roles ur
+            JOIN public.role_permissions rp ON ur.role_id = rp.role_id
+            JOIN public.permissions p ON rp.permission_id = p.id
+            WHERE ur.user_id = p_user_id
+        ), '[]'::jsonb),
+        'roles', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', r.id,
+                'name', r.name,
+                'description', r.description
+            ))
+            FROM public.user_roles ur
+            JOIN public.roles r ON ur.role_id = r.id
+            WHERE ur.user_id = p_user_id
+        ), '[]'::jsonb),
+        'store_ids', COALESCE((
+            SELECT jsonb_agg(us.shop_id)
+            FROM public.user_shops us
+            WHERE us.user_id = p_user_id
+        ), '[]'::jsonb)
+    );
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.get_user_auth_bundle(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_user_auth_bundle(UUID) TO service_role;
+
+COMMENT ON FUNCTION public.get_user_auth_bundle(UUID) IS 'Returns permissions, roles and store_ids for a user in one JSON object';
@@ -0,0 +1,33 @@
+-- =============================================================================
+-- REALTIME CACHE INVALIDATION
+-- =============================================================================
+-- Migration: 093_realtime_cache_invalidation.sql
+-- Description: Publishes the authorization and rate limit tables to Supabase
+--              realtime so the backend can drop its caches on change instead
+--              of polling
+-- Date: 2026-01-26
+-- =============================================================================
+
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'rate_limit_configs',
+        'roles',
+        'permissions',
+        'role_permissions',
+        'user_roles',
+        'user_shops'
+    ]
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_publication_tables
+            WHERE pubname = 'supabase_realtime'
+              AND schemaname = 'public'
+              AND tablename = t
+        ) THEN
+            EXECUTE format('ALTER PUBLICATION supabase_realtime ADD TABLE public.%I', t);
+        END IF;
+    END LOOP;
+END $$;
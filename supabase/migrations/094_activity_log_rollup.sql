@@ -0,0 +1,86 @@
+-- =============================================================================
+-- ACTIVITY LOG DAILY ROLLUP
+-- =============================================================================
+-- Migration: 094_activity_log_rollup.sql
+-- Description: Keeps per-day, per-event-type counts of app_activity_logs in a
+--              small rollup table maintained by trigger, so the activity stats
+--              endpoint no longer counts the whole audit table on every call
+-- Date: 2026-01-26
+-- =============================================================================
+
+-- -----------------------------------------------------------------------------
+-- 1. ROLLUP TABLE
+-- -----------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.activity_log_daily_rollup (
+    day DATE NOT NULL,
+    event_type TEXT NOT NULL,
+    total BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, event_type)
+);
+
+ALTER TABLE public.activity_log_daily_rollup ENABLE ROW LEVEL SECURITY;
+
+GRANT ALL ON public.activity_log_daily_rollup TO postgres;
+GRANT ALL ON public.activity_log_daily_rollup TO service_role;
+
+-- -----------------------------------------------------------------------------
+-- 2. MAINTENANCE TRIGGER
+-- -----------------------------------------------------------------------------
+-- SECURITY DEFINER: anon/authenticated may insert logs but not the rollup
+CREATE OR REPLACE FUNCTION public.update_activity_log_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO public.activity_log_daily_rollup (day, event_type, total)
+        VALUES ((NEW.timestamp AT TIME ZONE 'utc')::date, NEW.event_type, 1)
+        ON CONFLICT (day, event_type)
+        DO UPDATE SET total = activity_log_daily_rollup.total + 1;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE public.activity_log_daily_rollup
+        SET total = total - 1
+        WHERE day = (OLD.timestamp AT TIME ZONE 'utc')::date
+          AND event_type = OLD.event_type;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trg_activity_log_rollup ON public.app_activity_logs;
+CREATE TRIGGER trg_activity_log_rollup
+    AFTER INSERT OR DELETE ON public.app_activity_logs
+    FOR EACH ROW EXECUTE FUNCTION public.update_activity_log_rollup();
+
+-- -----------------------------------------------------------------------------
+-- 3. BACKFILL EXISTING LOGS
+-- -----------------------------------------------------------------------------
+INSERT INTO public.activity_log_daily_rollup (day, event_type, total)
+SELECT (timestamp AT TIME ZONE 'utc')::date, event_type, COUNT(*)
+FROM public.app_activity_logs
+GROUP BY 1, 2
+ON CONFLICT (day, event_type) DO UPDATE SET total = EXCLUDED.total;
+
+-- -----------------------------------------------------------------------------
+-- 4. STATS RPC
+-- -----------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.get_activity_stats_fast()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_logs', COALESCE(SUM(total), 0),
+        'by_event', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('event_type', event_type, 'count', count) ORDER BY count DESC)
+            FROM (
+                SELECT event_type, SUM(total) AS count
+                FROM public.activity_log_daily_rollup
+                GROUP BY event_type
+            ) per_event
+        ), '[]'::jsonb)
+    )
+    FROM public.activity_log_daily_rollup;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.get_activity_stats_fast() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_activity_stats_fast() TO service_role;
+
+COMMENT ON FUNCTION public.get_activity_stats_fast() IS 'Activity log totals by event type, read from activity_log_daily_rollup';
@@ -0,0 +1,54 @@
+-- =============================================================================
+-- VARIANCE PAGE RPC
+-- =============================================================================
+-- Migration: 095_variance_page_rpc.sql
+-- Description: Returns one page of variance logs together with the filtered
+--              total and pending count in a single round-trip, scanning the
+--              filtered rows once instead of once per query
+-- Date: 2026-01-26
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_variance_page(
+    p_store_ids INTEGER[] DEFAULT NULL,
+    p_status TEXT DEFAULT NULL,
+    p_variance_type TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 50,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS JSONB AS $$
+    WITH filtered AS MATERIALIZED (
+        SELECT
+            vl.*,
+            ds.store_id,
+            s.name AS store_name,
+            ds.settlement_date,
+            submitter.full_name AS submitted_by_name,
+            resolver.full_name AS resolved_by_name
+        FROM public.variance_logs vl
+        JOIN public.daily_settlements ds ON ds.id = vl.settlement_id
+        JOIN public.shops s ON s.id = ds.store_id
+        LEFT JOIN public.profiles submitter ON submitter.id = ds.submitted_by
+        LEFT JOIN public.profiles resolver ON resolver.id = vl.resolved_by
+        WHERE (p_store_ids IS NULL OR ds.store_id = ANY(p_store_ids))
+          AND (p_status IS NULL OR vl.status::text = p_status)
+          AND (p_variance_type IS NULL OR vl.variance_type::text = p_variance_type)
+    )
+    SELECT jsonb_build_object(
+        'items', COALESCE((
+            SELECT jsonb_agg(to_jsonb(page) ORDER BY page.created_at DESC)
+            FROM (
+                SELECT * FROM filtered
+                ORDER BY created_at DESC
+                LIMIT p_limit OFFSET p_offset
+            ) page
+        ), '[]'::jsonb),
+        'total', COUNT(*),
+        'pending_count', COUNT(*) FILTER (WHERE status = 'PENDING')
+    )
+    FROM filtered;
+$$ LANGUAGE sql STABLE SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.get_variance_page(INTEGER[], TEXT, TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_variance_page(INTEGER[], TEXT, TEXT, INTEGER, INTEGER) TO service_role;
+
+COMMENT ON FUNCTION public.get_variance_page(INTEGER[], TEXT, TEXT, INTEGER, INTEGER) IS 'Page of variance logs with filtered total and pending count';
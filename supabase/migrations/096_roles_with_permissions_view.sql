@@ -0,0 +1,26 @@
+-- =============================================================================
+-- ROLES WITH PERMISSIONS VIEW
+-- =============================================================================
+-- Migration: 096_roles_with_permissions_view.sql
+-- Description: Roles with their permission keys aggregated in Postgres, so the
+--              admin roles list is a single select with no enrichment in Python
+-- Date: 2026-01-26
+-- =============================================================================
+
+CREATE OR REPLACE VIEW public.roles_with_permissions
+WITH (security_invoker = true) AS
+SELECT
+    r.*,
+    COALESCE(
+        jsonb_agg(p.key ORDER BY p.key) FILTER (WHERE p.key IS NOT NULL),
+        '[]'::jsonb
+    ) AS permissions
+FROM public.roles r
+LEFT JOIN public.role_permissions rp ON rp.role_id = r.id
+LEFT JOIN public.permissions p ON p.id = rp.permission_id
+GROUP BY r.id;
+
+REVOKE ALL ON public.roles_with_permissions FROM anon, authenticated;
+GRANT SELECT ON public.roles_with_permissions TO service_role;
+
+COMMENT ON VIEW public.roles_with_permissions IS 'Roles with an array of their permission keys';
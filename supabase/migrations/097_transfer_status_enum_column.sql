@@ -0,0 +1,23 @@
+-- =============================================================================
+-- STOCK TRANSFER STATUS AS ENUM
+-- =============================================================================
+-- Migration: 097_transfer_status_enum_column.sql
+-- Description: Stores stock_transfers.status as the transfer_status enum
+--              created in 086 instead of TEXT + CHECK. Enum values are stored
+--              as fixed 4-byte OIDs and compared without collation, matching
+--              supplier_status_enum on suppliers.status. String literals such
+--              as 'APPROVED' keep working, so the API and RPCs are unchanged.
+-- Date: 2026-01-26
+-- =============================================================================
+
+ALTER TABLE public.stock_transfers
+    DROP CONSTRAINT IF EXISTS stock_transfers_status_check;
+
+ALTER TABLE public.stock_transfers
+    ALTER COLUMN status DROP DEFAULT;
+
+ALTER TABLE public.stock_transfers
+    ALTER COLUMN status TYPE transfer_status USING status::transfer_status;
+
+ALTER TABLE public.stock_transfers
+    ALTER COLUMN status SET DEFAULT 'SENT';
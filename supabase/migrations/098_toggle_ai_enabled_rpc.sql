@@ -0,0 +1,22 @@
+-- =============================================================================
+-- TOGGLE AI ENABLED RPC
+-- =============================================================================
+-- Migration: 098_toggle_ai_enabled_rpc.sql
+-- Description: Flips ai_agent_configs.enabled in one statement and returns the
+--              new state (NULL when the config does not exist), replacing the
+--              read-then-update pair of round-trips in the AI config toggle
+-- Date: 2026-01-26
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.toggle_ai_enabled(p_config_id INTEGER)
+RETURNS BOOLEAN AS $$
+    UPDATE public.ai_agent_configs
+    SET enabled = NOT enabled
+    WHERE id = p_config_id
+    RETURNING enabled;
+$$ LANGUAGE sql VOLATILE SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.toggle_ai_enabled(INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.toggle_ai_enabled(INTEGER) TO service_role;
+
+COMMENT ON FUNCTION public.toggle_ai_enabled(INTEGER) IS 'Toggles an AI agent config and returns the new enabled state';
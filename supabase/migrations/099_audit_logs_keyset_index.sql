@@ -0,0 +1,12 @@
+-- =============================================================================
+-- AUDIT LOGS KEYSET INDEX
+-- =============================================================================
+-- Migration: 099_audit_logs_keyset_index.sql
+-- Description: Index matching the admin logs keyset cursor, which orders and
+--              pages by (timestamp, id) so batch-inserted logs sharing a
+--              timestamp are not skipped at a page boundary
+-- Date: 2026-01-26
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp_id
+    ON public.audit_logs (timestamp DESC, id DESC);